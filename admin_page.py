@@ -0,0 +1,70 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from ai_executor import ai_executor
+from charts import chart_cache
+from history_store import history_writer
+from image_dedupe import image_index
+from image_prep import image_stats
+from llm_metrics import llm_metrics, METRICS_HOST, METRICS_PORT
+from resilience import resilience
+from response_cache import response_cache
+from single_flight import single_flight
+from storage import fitness_store
+
+
+# ================= HIDDEN ADMIN PAGE =================
+# Not linked anywhere. Open with ?admin=<ADMIN_TOKEN>; without ADMIN_TOKEN
+# set the page is disabled.
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def is_admin_request():
+    return bool(ADMIN_TOKEN) and st.query_params.get("admin") == ADMIN_TOKEN
+
+
+def show_admin_page():
+    st.title("🛠️ AI Health Companion – Admin")
+
+    rows = llm_metrics.summary()
+    total_calls = sum(r["calls"] for r in rows)
+    total_errors = sum(r["errors"] for r in rows)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("LLM requests", total_calls)
+    col2.metric("Errors", total_errors)
+    col3.metric("Cache hit rate", f"{response_cache.stats()['hit_rate']:.0%}")
+
+    st.subheader("📊 Per feature")
+    if rows:
+        st.dataframe(pd.DataFrame(rows).set_index("feature"), width="stretch")
+    else:
+        st.info("No AI calls recorded since the server started.")
+
+    st.subheader("⚙️ Runtime")
+    st.json({
+        "executor": ai_executor.stats(),
+        "single_flight": single_flight.stats(),
+        "resilience": resilience.stats(),
+        "cache": response_cache.stats(),
+        "image_prep": image_stats.stats(),
+        "image_dedupe": image_index.stats(),
+        "storage": fitness_store.stats(),
+        "history": history_writer.stats(),
+        "charts": chart_cache.stats(),
+    })
+
+    if METRICS_PORT:
+        st.caption(f"Prometheus: http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+
+    col1, col2 = st.columns(2)
+    if col1.button("🔄 Reset LLM metrics"):
+        llm_metrics.reset()
+        st.rerun()
+
+    # the response cache is shared by every session, so only admins clear it
+    if col2.button("🧹 Clear AI Cache"):
+        response_cache.clear()
+        st.success("Cache cleared!")
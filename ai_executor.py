@@ -0,0 +1,277 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+try:
+    from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequestType
+except ImportError:
+    ScriptRequestType = None
+
+logger = logging.getLogger(__name__)
+
+
+# ================= EXECUTOR CONFIG =================
+MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "8"))
+REQUEST_TIMEOUT = float(os.getenv("AI_REQUEST_TIMEOUT", "60"))
+POLL_INTERVAL = 0.1
+REAP_INTERVAL = 30
+
+_STREAM_DONE = object()
+
+
+class AICancelled(Exception):
+    pass
+
+
+class AITimeout(Exception):
+    pass
+
+
+def current_session_id():
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else None
+
+
+def _session_alive(session_id):
+    if session_id is None or not runtime.exists():
+        return True
+    return runtime.get_instance().is_active_session(session_id)
+
+
+def _pending_request_state(ctx):
+    # Streamlit has no public "is a rerun queued?" call: a widget interaction
+    # while we block only sets ScriptRequests._state, which Streamlit itself
+    # checks on the next st.* call. Read it only if it still looks the way it
+    # does in Streamlit 1.65; otherwise the wait ends on timeout or disconnect.
+    requests = getattr(ctx, "script_requests", None)
+    state = getattr(requests, "_state", None)
+    if ScriptRequestType is None or not isinstance(state, ScriptRequestType):
+        return None
+    return state
+
+
+_warned_no_rerun_check = False
+
+
+def _rerun_requested():
+    global _warned_no_rerun_check
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return False
+
+    state = _pending_request_state(ctx)
+    if state is None:
+        if not _warned_no_rerun_check:
+            _warned_no_rerun_check = True
+            logger.warning("Can't see queued reruns in this Streamlit version; "
+                           "AI waits end on timeout or disconnect only")
+        return False
+    return state != ScriptRequestType.CONTINUE
+
+
+# ================= PROCESS-WIDE GEMINI EXECUTOR =================
+class AIExecutor:
+    def __init__(self, max_workers=MAX_CONCURRENCY, timeout=REQUEST_TIMEOUT):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="gemini"
+        )
+        self._lock = threading.Lock()
+        self._session_futures = {}   # session_id -> set of futures
+        self._reaper = None
+
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.timed_out = 0
+        self.abandoned = 0
+
+    def submit(self, fn, *args, session_id=None, shared=False, **kwargs):
+        # shared futures are owned by no session, so reruns and the
+        # disconnect reaper never cancel them (see single_flight.py)
+        if shared:
+            session_id = None
+        elif session_id is None:
+            session_id = current_session_id()
+
+        future = self._pool.submit(self._run, fn, args, kwargs)
+
+        with self._lock:
+            self.submitted += 1
+            self._session_futures.setdefault(session_id, set()).add(future)
+
+        future.add_done_callback(lambda f: self._forget(session_id, f))
+        self._start_reaper()
+        return future
+
+    def _run(self, fn, args, kwargs):
+        with self._lock:
+            self.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    def _forget(self, session_id, future):
+        with self._lock:
+            futures = self._session_futures.get(session_id)
+            if futures is not None:
+                futures.discard(future)
+                if not futures:
+                    del self._session_futures[session_id]
+            if future.cancelled():
+                self.cancelled += 1
+
+    def wait(self, future, timeout=None, spinner_text=None, cancel=True):
+        # cancel=False leaves the future running when this caller gives up,
+        # for futures that other sessions are also waiting on.
+        if spinner_text:
+            import streamlit as st
+            with st.spinner(spinner_text):
+                return self._wait(future, timeout, cancel)
+        return self._wait(future, timeout, cancel)
+
+    def _wait(self, future, timeout, cancel):
+        session_id = current_session_id()
+        deadline = time.monotonic() + (timeout or self.timeout)
+
+        while True:
+            try:
+                return future.result(timeout=POLL_INTERVAL)
+            except FutureTimeout:
+                pass
+
+            if time.monotonic() >= deadline:
+                if cancel:
+                    self.abandon(future)
+                with self._lock:
+                    self.timed_out += 1
+                raise AITimeout(f"AI request timed out after {timeout or self.timeout:.0f}s")
+
+            if _rerun_requested() or not _session_alive(session_id):
+                if cancel:
+                    self.abandon(future)
+                raise AICancelled("AI request cancelled (page rerun)")
+
+    def abandon(self, future):
+        # A queued call is dropped. One already running on a worker can't be
+        # interrupted from here; it ends by its own request timeout, which
+        # callers derive from the same deadline (see Resilience.call).
+        if future.cancel() or future.done():
+            return
+        with self._lock:
+            self.abandoned += 1
+
+    def stream(self, fn, *args, timeout=None):
+        # fn(*args, emit) runs on a worker and calls emit(chunk) per chunk.
+        # Chunks are yielded here on the script thread; timeout is the longest
+        # allowed gap between two chunks.
+        chunks = queue.Queue()
+        stop = threading.Event()
+
+        def emit(chunk):
+            if stop.is_set():
+                raise AICancelled("AI stream cancelled")
+            chunks.put(chunk)
+
+        def run():
+            try:
+                fn(*args, emit)
+            finally:
+                chunks.put(_STREAM_DONE)
+
+        future = self.submit(run)
+        session_id = current_session_id()
+        idle_timeout = timeout or self.timeout
+        deadline = time.monotonic() + idle_timeout
+
+        try:
+            while True:
+                try:
+                    chunk = chunks.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if time.monotonic() >= deadline:
+                        with self._lock:
+                            self.timed_out += 1
+                        raise AITimeout(f"AI stream stalled for {idle_timeout:.0f}s")
+                    if _rerun_requested() or not _session_alive(session_id):
+                        raise AICancelled("AI request cancelled (page rerun)")
+                    continue
+
+                if chunk is _STREAM_DONE:
+                    break
+
+                deadline = time.monotonic() + idle_timeout
+                yield chunk
+
+            # surface worker exceptions
+            future.result()
+        finally:
+            stop.set()
+            future.cancel()
+
+    def cancel_session(self, session_id):
+        with self._lock:
+            futures = list(self._session_futures.get(session_id, ()))
+        for future in futures:
+            future.cancel()
+
+    def start_run(self):
+        # Anything still queued for this session belongs to an abandoned rerun.
+        session_id = current_session_id()
+        if session_id is not None:
+            self.cancel_session(session_id)
+
+    def _start_reaper(self):
+        if self._reaper is not None:
+            return
+        with self._lock:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(
+                target=self._reap_loop,
+                name="gemini-reaper",
+                daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(REAP_INTERVAL)
+            with self._lock:
+                session_ids = list(self._session_futures)
+            for session_id in session_ids:
+                if not _session_alive(session_id):
+                    self.cancel_session(session_id)
+
+    def stats(self):
+        with self._lock:
+            queued = sum(
+                1 for futures in self._session_futures.values()
+                for f in futures if not f.running() and not f.done()
+            )
+            return {
+                "max_concurrency": self.max_workers,
+                "running": self.running,
+                "queued": queued,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+                "timed_out": self.timed_out,
+                "abandoned": self.abandoned,
+            }
+
+
+# Shared by every Streamlit session in this process.
+ai_executor = AIExecutor(MAX_CONCURRENCY, REQUEST_TIMEOUT)
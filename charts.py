@@ -0,0 +1,135 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+# ================= CHART CONFIG =================
+# Tracker charts are native Vega-Lite specs, built once per
+# (series, series version, chart type, theme) and reused by every rerun and
+# tab that draws the same data. Nothing is rasterized server-side, so there
+# are no matplotlib figures to leak.
+CHART_CACHE_SIZE = int(os.getenv("CHART_CACHE_SIZE", "256"))
+FORECAST_DAYS = 7
+
+THEME_COLORS = {
+    "dark": {"text": "#e2e8f0", "grid": "#334155", "line": "#38bdf8", "forecast": "#f472b6"},
+    "light": {"text": "#1f2937", "grid": "#e5e7eb", "line": "#2563eb", "forecast": "#db2777"},
+}
+
+
+def _config(theme):
+    colors = THEME_COLORS.get(theme, THEME_COLORS["light"])
+    return {
+        "background": "transparent",
+        "view": {"stroke": None},
+        "title": {"color": colors["text"]},
+        "axis": {"labelColor": colors["text"], "titleColor": colors["text"], "gridColor": colors["grid"]},
+        "legend": {"labelColor": colors["text"], "titleColor": colors["text"]},
+        "line": {"color": colors["line"]},
+    }
+
+
+# ================= SPEC BUILDERS =================
+def weight_trend_spec(series, theme):
+    data = pd.DataFrame({
+        "Day": np.arange(1, len(series) + 1),
+        "Weight (kg)": series.tolist(),
+    })
+    return {
+        "title": "Weight Trend",
+        "data": {"values": data},
+        "mark": {"type": "line", "point": True, "tooltip": True},
+        "encoding": {
+            "x": {"field": "Day", "type": "quantitative", "title": "Days"},
+            "y": {"field": "Weight (kg)", "type": "quantitative", "scale": {"zero": False}},
+        },
+        "config": _config(theme),
+    }
+
+
+def weight_forecast_spec(series, theme):
+    # linear trend over the logged weights, extended FORECAST_DAYS ahead
+    weights = series.values
+    days = np.arange(len(weights))
+    slope, intercept = np.polyfit(days, weights, 1)
+    future_days = np.arange(len(days), len(days) + FORECAST_DAYS)
+    future = np.round(slope * future_days + intercept, 2).tolist()
+
+    data = pd.DataFrame({
+        "Day": np.arange(1, len(days) + FORECAST_DAYS + 1),
+        "Weight (kg)": series.tolist() + future,
+        "Trend": ["Logged"] * len(days) + ["Forecast"] * FORECAST_DAYS,
+    })
+    colors = THEME_COLORS.get(theme, THEME_COLORS["light"])
+    return {
+        "title": "Weight Trend",
+        "data": {"values": data},
+        "mark": {"type": "line", "point": True, "tooltip": True},
+        "encoding": {
+            "x": {"field": "Day", "type": "quantitative", "title": "Days"},
+            "y": {"field": "Weight (kg)", "type": "quantitative", "scale": {"zero": False}},
+            "color": {
+                "field": "Trend", "type": "nominal",
+                "scale": {"domain": ["Logged", "Forecast"], "range": [colors["line"], colors["forecast"]]},
+            },
+        },
+        "config": _config(theme),
+    }
+
+
+CHART_TYPES = {
+    "weight_trend": weight_trend_spec,
+    "weight_forecast": weight_forecast_spec,
+}
+
+
+# ================= LRU SPEC CACHE =================
+class ChartCache:
+    def __init__(self, max_entries=CHART_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # (token, version, chart, theme) -> spec
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def chart(self, series, chart, theme):
+        # a series' version moves on every append, so stale specs are never
+        # served; they just age out of the LRU
+        key = (series.token, series.version, chart, theme)
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return spec
+            self.misses += 1
+
+        spec = CHART_TYPES[chart](series, theme)
+
+        with self._lock:
+            self._entries[key] = spec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return spec
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Shared by every Streamlit session in this process.
+chart_cache = ChartCache(CHART_CACHE_SIZE)
@@ -0,0 +1,49 @@
+import os
+import time
+
+import streamlit as st
+
+from model_backend import create_model, use_fake_backend
+
+
+MODEL_NAME = "gemini-2.5-flash"
+
+
+# ================= SHARED CLIENTS =================
+# Built once per server process on first use; every rerun of every session
+# only looks the handle up.
+@st.cache_resource(show_spinner=False)
+def get_model(model_name, api_key=None):
+    return create_model(model_name, api_key)
+
+
+@st.cache_resource(show_spinner=False)
+def get_recognizer():
+    import speech_recognition as sr
+    return sr.Recognizer()
+
+
+def get_api_key():
+    try:
+        key = st.secrets.get("GOOGLE_API_KEY")
+    except Exception:
+        # no secrets.toml (e.g. launched from serve.py or a container)
+        key = None
+    return key or os.getenv("GOOGLE_API_KEY")
+
+
+# ================= WARM-UP =================
+# Called by serve.py before the server accepts connections, so the first
+# user on a fresh replica doesn't pay for client construction.
+def warm_up(model_name=MODEL_NAME):
+    timings = {}
+
+    start = time.perf_counter()
+    api_key = None if use_fake_backend() else get_api_key()
+    if use_fake_backend() or api_key:
+        get_model(model_name, api_key)
+    timings["model"] = time.perf_counter() - start
+
+    # the speech recognizer is left to the first voice session: building it
+    # imports speech_recognition, which most workers never need
+    return timings
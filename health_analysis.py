@@ -0,0 +1,69 @@
+import json
+import re
+
+
+# ================= FULL HEALTH ANALYSIS (ONE CALL) =================
+# The AI Doctor+ sections below used to be six separate Gemini calls, each
+# resending the same tracker data. One JSON response now fills all of them.
+ANALYSIS_SECTIONS = {
+    "future_prediction": "Future diseases, risk level, prevention plan",
+    "health_type": "Classify as Fit / At Risk / Unhealthy / Athlete and explain why",
+    "health_intelligence": "Hidden risks, future problems, lifestyle plan",
+    "mind_body": "Mental stress impact on body, possible diseases from stress, advice",
+    "weak_areas": "Weakest body part, why, how to improve",
+    "weekly_report": "Summary, progress, suggestions, motivation",
+}
+
+# Gemini JSON mode: the reply is a bare JSON object, no prose around it
+JSON_CONFIG = {"response_mime_type": "application/json"}
+
+
+def build_analysis_prompt(lang_instruction, data):
+    data_lines = "\n".join(f"{name}: {value}" for name, value in data.items())
+    fields = ",\n".join(
+        f'  "{key}": "<markdown: {what}>"'
+        for key, what in ANALYSIS_SECTIONS.items()
+    )
+
+    return f"""
+{lang_instruction}
+
+User health data:
+{data_lines}
+
+Analyse this data and reply with ONE JSON object with exactly these keys.
+Each value is a short markdown string with bullet points.
+{{
+{fields}
+}}
+"""
+
+
+def _to_markdown(value):
+    if isinstance(value, list):
+        return "\n".join(f"- {_to_markdown(item)}" for item in value)
+    if isinstance(value, dict):
+        return "\n".join(f"- **{k}:** {_to_markdown(v)}" for k, v in value.items())
+    return str(value).strip()
+
+
+def parse_analysis(text):
+    # JSON mode should return a bare object, but tolerate ```json fences
+    # and stray text around it.
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if not match:
+        raise ValueError("AI reply contained no JSON object")
+
+    data = json.loads(match.group(0))
+    if not isinstance(data, dict):
+        raise ValueError("AI reply was not a JSON object")
+
+    sections = {}
+    for key in ANALYSIS_SECTIONS:
+        value = data.get(key)
+        if value:
+            sections[key] = _to_markdown(value)
+
+    if not sections:
+        raise ValueError("AI reply had none of the expected sections")
+    return sections
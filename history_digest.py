@@ -0,0 +1,158 @@
+import os
+import re
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+import numpy as np
+
+from timeseries import TimeSeries, FLOAT
+
+
+# ================= HISTORY DIGEST CONFIG =================
+# Approximate token budget for all history digests in one prompt.
+# Call sites with several histories split it, e.g. HISTORY_BUDGET // 2.
+HISTORY_BUDGET = int(os.getenv("AI_HISTORY_TOKEN_BUDGET", "240"))
+CHARS_PER_TOKEN = 4
+RECENT_N = 7
+WEEKS_SHOWN = 4
+
+STOPWORDS = {
+    "and", "the", "a", "an", "i", "my", "me", "have", "has", "is", "am", "in",
+    "of", "to", "with", "since", "for", "on", "at", "it", "feel", "feeling",
+    "very", "bit", "some", "from", "also",
+}
+
+
+def _fmt(value):
+    return f"{value:.1f}".rstrip("0").rstrip(".")
+
+
+def _is_numeric(values):
+    return all(
+        isinstance(v, (int, float, np.number)) and not isinstance(v, bool)
+        for v in values
+    )
+
+
+def _is_categorical(values):
+    distinct = set(values)
+    return len(distinct) <= 12 and sum(len(str(v)) for v in distinct) / len(distinct) <= 20
+
+
+def _weekly_means(values, timestamps):
+    # mean per calendar week (ISO, Monday-Sunday, local time) of the entry
+    # dates, newest first; timestamps are sorted, as TimeSeries keeps them
+    days = (np.asarray(timestamps, dtype=np.int64) + time.localtime().tm_gmtoff) // 86400
+    # 1970-01-01 was a Thursday: +3 makes each week start on a Monday
+    weeks = (days + 3) // 7
+    ids, starts = np.unique(weeks, return_index=True)
+    means = np.add.reduceat(values, starts) / np.diff(np.append(starts, len(values)))
+
+    out = []
+    for week, mean in zip(ids[::-1][:WEEKS_SHOWN], means[::-1][:WEEKS_SHOWN]):
+        monday = date(1970, 1, 1) + timedelta(days=int(week) * 7 - 3)
+        out.append(f"W{monday.isocalendar()[1]} {_fmt(mean)}")
+    return out
+
+
+# ================= DIGESTS =================
+def numeric_digest(values, unit="", timestamps=None):
+    arr = np.asarray(values, dtype=float)
+    unit = f" {unit}" if unit else ""
+
+    parts = [
+        f"{arr.size} entries",
+        f"min {_fmt(arr.min())}, max {_fmt(arr.max())}, mean {_fmt(arr.mean())}{unit}",
+    ]
+
+    if arr.size >= 2:
+        slope = np.polyfit(np.arange(arr.size), arr, 1)[0]
+        parts.append(f"trend {slope:+.2f}{unit}/entry")
+
+    # grouped by the week each entry was logged in, however often that was;
+    # plain lists carry no dates, so they get no weekly line
+    if timestamps is not None and arr.size > RECENT_N:
+        parts.append("weekly avg (newest first): " + ", ".join(_weekly_means(arr, timestamps)))
+
+    parts.append(f"recent {min(RECENT_N, arr.size)}: " + ", ".join(_fmt(v) for v in arr[-RECENT_N:]))
+    return parts
+
+
+def categorical_digest(values):
+    counts = Counter(values)
+    total = len(values)
+
+    frequency = ", ".join(
+        f"{label} {count * 100 // total}%"
+        for label, count in counts.most_common()
+    )
+    recent = ", ".join(str(v) for v in values[-RECENT_N:])
+
+    return [
+        f"{total} entries",
+        f"frequency: {frequency}",
+        f"recent {min(RECENT_N, total)}: {recent}",
+    ]
+
+
+def text_digest(values, recent=3):
+    words = Counter(
+        word
+        for text in values
+        for word in re.findall(r"[a-zA-Zऀ-ॿ]+", str(text).lower())
+        if word not in STOPWORDS and len(word) > 2
+    )
+    common = ", ".join(f"{w} x{n}" for w, n in words.most_common(8))
+    latest = "; ".join(f'"{str(t).strip()[:80]}"' for t in values[-recent:])
+
+    parts = [f"{len(values)} reports"]
+    if common:
+        parts.append(f"common words: {common}")
+    parts.append(f"latest: {latest}")
+    return parts
+
+
+def _fit_budget(parts, budget):
+    # Keep whole parts in priority order while they fit; the first part
+    # (entry count) always stays.
+    max_chars = max(budget, 1) * CHARS_PER_TOKEN
+    text = parts[0]
+
+    for part in parts[1:]:
+        candidate = f"{text} | {part}"
+        if len(candidate) > max_chars:
+            room = max_chars - len(text) - 4
+            if room > 20:
+                text = candidate[:len(text) + 3 + room] + "…"
+            break
+        text = candidate
+
+    return text
+
+
+def summarize_history(values, unit="", budget=HISTORY_BUDGET):
+    # Bounded stand-in for "{history_list}" in prompts: the size stays the
+    # same whether the user has 10 entries or 10,000.
+    if isinstance(values, TimeSeries):
+        # already typed: no per-entry scan / conversion needed
+        if not values:
+            return "No data"
+        if values.kind == FLOAT:
+            return _fit_budget(numeric_digest(values.values, unit, values.timestamps), budget)
+        return _fit_budget(categorical_digest(values.labels()), budget)
+
+    values = list(values) if values is not None else []
+    values = [v for v in values if v is not None]
+
+    if not values:
+        return "No data"
+
+    if _is_numeric(values):
+        parts = numeric_digest(values, unit)
+    elif _is_categorical(values):
+        parts = categorical_digest(values)
+    else:
+        parts = text_digest(values)
+
+    return _fit_budget(parts, budget)
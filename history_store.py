@@ -0,0 +1,346 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from rollups import (
+    Rollup, ROLLUP_SERIES, RESOLUTIONS, ZOOM_LEVELS,
+    HISTORY_RETENTION_DAYS, ROLLUP_PRUNE_INTERVAL,
+)
+from storage import SqlitePool, DB_POOL_SIZE
+from timeseries import TimeSeries, FLOAT, CATEGORY
+from write_buffer import WriteBehindBuffer, WRITE_BEHIND
+
+logger = logging.getLogger(__name__)
+
+
+# ================= HISTORY STORE CONFIG =================
+# Tracker histories (weight, mood, sleep, ...) used to live only in
+# st.session_state and were lost on refresh / logout. They are kept per
+# verified account or opted-in browser link here (identity.history_owner);
+# a session loads a series the first time a tab needs it.
+HISTORY_DB_FILE = os.getenv("HISTORY_DB_FILE", "user_history.sqlite")
+HISTORY_LOAD_LIMIT = int(os.getenv("HISTORY_LOAD_LIMIT", "365"))   # newest entries per series
+# numeric series are also kept packed (TimeSeries.to_bytes); the blob is
+# rewritten once this many raw points have been appended after it
+HISTORY_SNAPSHOT_EVERY = int(os.getenv("HISTORY_SNAPSHOT_EVERY", "32"))
+
+HISTORY_SERIES = (
+    "weight_history",
+    "mood_history",
+    "sleep_history",
+    "water_history",
+    "symptom_history",
+    "memory",
+)
+# numeric / mood series are held as compact TimeSeries; symptoms and the
+# voice chat memory are free text and stay plain lists
+SERIES_KINDS = {
+    "weight_history": FLOAT,
+    "sleep_history": FLOAT,
+    "water_history": FLOAT,
+    "mood_history": CATEGORY,
+}
+
+
+# ================= SQLITE HISTORY DB =================
+class HistoryDB:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL,
+            series TEXT NOT NULL,
+            ts REAL NOT NULL,
+            value TEXT NOT NULL
+        )
+    """
+    # one user's series is a contiguous index range, newest last
+    INDEX = "CREATE INDEX IF NOT EXISTS idx_history_user_series ON history(username, series, id)"
+    # lets the retention sweep find old raw points without a full scan
+    TS_INDEX = "CREATE INDEX IF NOT EXISTS idx_history_series_ts ON history(series, ts)"
+    ROLLUP_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rollup (
+            username TEXT NOT NULL,
+            series TEXT NOT NULL,
+            resolution TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            total REAL NOT NULL,
+            lo REAL NOT NULL,
+            hi REAL NOT NULL,
+            last REAL NOT NULL,
+            last_ts REAL NOT NULL,
+            PRIMARY KEY (username, series, resolution, bucket)
+        ) WITHOUT ROWID
+    """
+    META_SCHEMA = "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+    # newest points of a numeric series as one packed blob, up to history.id last_id
+    SNAPSHOT_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS snapshot (
+            username TEXT NOT NULL,
+            series TEXT NOT NULL,
+            last_id INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (username, series)
+        ) WITHOUT ROWID
+    """
+    INSERT = "INSERT INTO history(username, series, ts, value) VALUES (?, ?, ?, ?)"
+    LOAD = """
+        SELECT id, ts, value FROM (
+            SELECT id, ts, value FROM history
+            WHERE username = ? AND series = ?
+            ORDER BY id DESC LIMIT ?
+        ) ORDER BY id
+    """
+    LOAD_SNAPSHOT = "SELECT last_id, data FROM snapshot WHERE username = ? AND series = ?"
+    LOAD_AFTER = """
+        SELECT id, ts, value FROM history
+        WHERE username = ? AND series = ? AND id > ?
+        ORDER BY id
+    """
+    SAVE_SNAPSHOT = """
+        INSERT INTO snapshot VALUES (?, ?, ?, ?)
+        ON CONFLICT (username, series) DO UPDATE SET
+            last_id = excluded.last_id,
+            data = excluded.data
+        WHERE excluded.last_id > snapshot.last_id
+    """
+    # merge a batch's aggregates into the stored bucket
+    UPSERT_ROLLUP = """
+        INSERT INTO rollup VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (username, series, resolution, bucket) DO UPDATE SET
+            count = count + excluded.count,
+            total = total + excluded.total,
+            lo = min(lo, excluded.lo),
+            hi = max(hi, excluded.hi),
+            last = CASE WHEN excluded.last_ts >= last_ts THEN excluded.last ELSE last END,
+            last_ts = max(last_ts, excluded.last_ts)
+    """
+    LOAD_ROLLUP = """
+        SELECT bucket, count, total, lo, hi, last, last_ts FROM rollup
+        WHERE username = ? AND series = ? AND resolution = ?
+    """
+
+    def __init__(self, path=HISTORY_DB_FILE, pool_size=DB_POOL_SIZE,
+                 retention_days=HISTORY_RETENTION_DAYS, prune_interval=ROLLUP_PRUNE_INTERVAL):
+        self.path = path
+        self.retention_days = retention_days
+        self.prune_interval = prune_interval
+        self._pool = SqlitePool(path, pool_size)
+        self._lock = threading.Lock()
+        self._pruned_at = None
+        self.loads = 0
+        self.load_ms = 0.0
+        self.aged_out = 0
+
+        with self._pool.connection() as db:
+            db.execute(self.SCHEMA)
+            db.execute(self.INDEX)
+            db.execute(self.TS_INDEX)
+            db.execute(self.ROLLUP_SCHEMA)
+            db.execute(self.META_SCHEMA)
+            db.execute(self.SNAPSHOT_SCHEMA)
+        self._build_rollups_once()
+
+    def _build_rollups_once(self):
+        # histories written before rollups existed
+        with self._pool.connection() as db:
+            if db.execute("SELECT 1 FROM meta WHERE key = 'rollups_built'").fetchone():
+                return
+            marks = ",".join("?" * len(ROLLUP_SERIES))
+            rows = db.execute(
+                f"SELECT username, series, ts, value FROM history WHERE series IN ({marks}) ORDER BY id",
+                ROLLUP_SERIES,
+            )
+            records = [{"username": u, "series": s, "ts": ts, "value": json.loads(v)} for u, s, ts, v in rows]
+            self._merge_rollups(db, records)
+            db.execute("INSERT INTO meta VALUES ('rollups_built', '1')")
+
+    def add(self, record):
+        self.add_many([record])
+
+    def add_many(self, records):
+        rows = [
+            (r["username"], r["series"], r["ts"], json.dumps(r["value"], ensure_ascii=False))
+            for r in records
+        ]
+        # raw points and their rollups commit together
+        with self._pool.connection() as db:
+            db.executemany(self.INSERT, rows)
+            self._merge_rollups(db, records)
+
+        if self._pruned_at is None or time.monotonic() - self._pruned_at >= self.prune_interval:
+            self.age_out()
+
+    def _merge_rollups(self, db, records):
+        # pre-aggregate the batch: one upsert per touched bucket, not per record
+        rollups = {}
+        for r in records:
+            if r["series"] not in ROLLUP_SERIES:
+                continue
+            for resolution in RESOLUTIONS:
+                key = (r["username"], r["series"], resolution)
+                rollup = rollups.get(key)
+                if rollup is None:
+                    rollup = rollups[key] = Rollup(resolution)
+                rollup.add(r["ts"], float(r["value"]))
+
+        db.executemany(self.UPSERT_ROLLUP, [
+            (*key, *row) for key, rollup in rollups.items() for row in rollup.rows()
+        ])
+
+    def age_out(self):
+        # raw points past the retention window only live on in the rollups
+        cutoff = time.time() - self.retention_days * 86400
+        marks = ",".join("?" * len(ROLLUP_SERIES))
+        with self._pool.connection() as db:
+            deleted = db.execute(
+                f"DELETE FROM history WHERE series IN ({marks}) AND ts < ?", (*ROLLUP_SERIES, cutoff)
+            ).rowcount
+            if deleted:
+                # packed copies may still hold the aged-out points; rebuilt on next load
+                db.execute(f"DELETE FROM snapshot WHERE series IN ({marks})", ROLLUP_SERIES)
+        self._pruned_at = time.monotonic()
+        self.aged_out += deleted
+        return deleted
+
+    def load_rollup(self, username, series, resolution):
+        with self._pool.connection() as db:
+            return db.execute(self.LOAD_ROLLUP, (username, series, resolution)).fetchall()
+
+    def load(self, username, series, limit=HISTORY_LOAD_LIMIT):
+        start = time.perf_counter()
+        with self._pool.connection() as db:
+            points = [(ts, json.loads(v)) for _, ts, v in db.execute(self.LOAD, (username, series, limit))]
+
+        self._count_load(start)
+        return points
+
+    def load_packed(self, username, series, limit=HISTORY_LOAD_LIMIT):
+        # -> (snapshot blob or None, raw points appended after it). Only the
+        # points since the last snapshot are decoded one by one.
+        start = time.perf_counter()
+        with self._pool.connection() as db:
+            row = db.execute(self.LOAD_SNAPSHOT, (username, series)).fetchone()
+            if row is None:
+                data = None
+                rows = db.execute(self.LOAD, (username, series, limit)).fetchall()
+            else:
+                last_id, data = row
+                rows = db.execute(self.LOAD_AFTER, (username, series, last_id)).fetchall()
+            points = [(ts, json.loads(v)) for _, ts, v in rows]
+
+            if len(rows) >= HISTORY_SNAPSHOT_EVERY:
+                packed = TimeSeries.from_bytes(data) if data is not None else TimeSeries(SERIES_KINDS[series])
+                packed.extend(points)
+                data, points = packed.tail(limit).to_bytes(), []
+                db.execute(self.SAVE_SNAPSHOT, (username, series, rows[-1][0], data))
+
+        self._count_load(start)
+        return data, points
+
+    def _count_load(self, start):
+        with self._lock:
+            self.loads += 1
+            self.load_ms += (time.perf_counter() - start) * 1000
+
+    def stats(self):
+        with self._pool.connection() as db:
+            (rows,) = db.execute("SELECT COUNT(*) FROM history").fetchone()
+            (snapshots,) = db.execute("SELECT COUNT(*) FROM snapshot").fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "rows": rows,
+            "snapshots": snapshots,
+            "loads": self.loads,
+            "avg_load_ms": round(self.load_ms / self.loads, 2) if self.loads else 0.0,
+            "aged_out": self.aged_out,
+            "pool_idle": self._pool.idle(),
+        }
+
+
+# ================= SESSION-SIDE SERIES =================
+class PersistentList(list):
+    # Drop-in for the old session_state lists: append() also queues the
+    # value for the history db, so only new entries are ever written.
+    def __init__(self, username, series, values=()):
+        super().__init__(values)
+        self.username = username
+        self.series = series
+
+    def append(self, value):
+        super().append(value)
+        _persist(self.username, self.series, time.time(), value)
+
+
+class PersistentSeries(TimeSeries):
+    def __init__(self, username, series, kind, points=(), snapshot=None):
+        super().__init__(kind)
+        self.username = username
+        self.series = series
+        self._rollups = {}   # resolution -> Rollup, loaded on first use
+        if snapshot is not None:
+            self.load_bytes(snapshot)
+        self.extend(points)
+
+    def append(self, value, ts=None):
+        # store the timestamp as kept in memory (clamped to stay sorted), so
+        # a reload gives back the same series
+        ts = super().append(value, ts)
+        _persist(self.username, self.series, ts, value)
+        for rollup in self._rollups.values():
+            rollup.add(ts, float(value))
+
+    def rollup(self, resolution):
+        if resolution not in self._rollups:
+            rows = history_writer.load_rollup(self.username, self.series, resolution)
+            self._rollups[resolution] = Rollup(resolution, rows)
+        return self._rollups[resolution]
+
+
+def _persist(username, series, ts, value):
+    history_writer.add({"username": username, "series": series, "ts": ts, "value": value})
+
+
+def open_series(username, series, limit=HISTORY_LOAD_LIMIT):
+    # username: identity.history_owner(), None for guests (session-only, nothing stored)
+    kind = SERIES_KINDS.get(series)
+    if username is None:
+        return TimeSeries(kind) if kind else []
+
+    # appends still queued (another tab, the previous page) must land first,
+    # or reopening a series right after a save would miss it
+    if history_writer is not history_db and not history_writer.flush():
+        logger.warning("History flush timed out, %s for %s may miss recent entries",
+                       series, username)
+    if kind:
+        snapshot, points = history_db.load_packed(username, series, limit)
+        return PersistentSeries(username, series, kind, points, snapshot)
+    points = history_db.load(username, series, limit)
+    return PersistentList(username, series, [value for _, value in points])
+
+
+def zoom_frame(series, zoom, stat="mean"):
+    # chart data at the resolution that matches the zoom level
+    days, resolution = ZOOM_LEVELS[zoom]
+    if resolution is None:
+        recent = series.between(time.time() - days * 86400)
+        index = pd.to_datetime(recent.timestamps, unit="s")
+        return pd.DataFrame({stat: recent.values}, index=index)
+
+    if isinstance(series, PersistentSeries):
+        rollup = series.rollup(resolution)
+    else:
+        rollup = Rollup.from_series(series, resolution)
+    since = (date.today() - timedelta(days=days)).isoformat() if days else None
+    return rollup.frame(since)[[stat]]
+
+
+# Shared by every Streamlit session in this process.
+history_db = HistoryDB(HISTORY_DB_FILE)
+history_writer = WriteBehindBuffer(history_db) if WRITE_BEHIND else history_db
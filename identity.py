@@ -0,0 +1,81 @@
+import hashlib
+import re
+import secrets
+from importlib.util import find_spec
+
+import streamlit as st
+
+
+# ================= VERIFIED IDENTITY =================
+# Histories and image lookups are kept per account, so their key has to come
+# from a login the server can verify, never from a name typed into the page.
+# Add an [auth] section (OIDC: Google, Auth0, Okta, ...) to
+# .streamlit/secrets.toml and `pip install Authlib` to enable st.login().
+def auth_configured():
+    if find_spec("authlib") is None:
+        return False
+    try:
+        return "auth" in st.secrets
+    except Exception:
+        # no secrets.toml
+        return False
+
+
+def verified_user():
+    # stable account id from the identity provider, None for guests
+    if not auth_configured() or not st.user.get("is_logged_in"):
+        return None
+    return f"{st.user.get('iss', '')}|{st.user.get('sub', '')}"
+
+
+def display_name():
+    if verified_user() is None:
+        return "Guest"
+    return st.user.get("name") or st.user.get("email") or "User"
+
+
+# ================= BROWSER LINK (NO LOGIN CONFIGURED) =================
+# Without [auth] a guest can opt in to keeping their history on a private
+# link: a random key in the page's query string (?hk=...). It can't be
+# guessed like a typed name, but whoever has the link sees that history.
+LINK_PARAM = "hk"
+_LINK_KEY = re.compile(r"[0-9a-f]{32}")
+
+
+def restore_link_key():
+    # once per run: pick the key up from a bookmarked link, or put it back
+    # after a page switch dropped the query string
+    if auth_configured():
+        return
+    key = st.query_params.get(LINK_PARAM)
+    if key and _LINK_KEY.fullmatch(key):
+        st.session_state._link_key = key
+    elif st.session_state.get("_link_key"):
+        st.query_params[LINK_PARAM] = st.session_state._link_key
+
+
+def create_link_key():
+    st.session_state._link_key = secrets.token_hex(16)
+    st.query_params[LINK_PARAM] = st.session_state._link_key
+
+
+def forget_link_key():
+    st.session_state.pop("_link_key", None)
+    st.query_params.pop(LINK_PARAM, None)
+
+
+def history_owner():
+    # who histories are stored for: the verified account, else the opt-in
+    # link key, else None (kept in this session only)
+    user = verified_user()
+    if user is not None:
+        return user
+    if not auth_configured() and st.session_state.get("_link_key"):
+        return f"link|{st.session_state._link_key}"
+    return None
+
+
+def public_id(owner):
+    # what shared tables (fitness records, leaderboard, CSV export) store:
+    # a link key is a password for its history, so only its hash leaves here
+    return hashlib.sha256(owner.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,173 @@
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+
+# ================= IMAGE DEDUPE CONFIG =================
+# A re-upload of the same photo (re-encoded, resized, re-compressed by the
+# phone) has different bytes, so the response cache misses it. Perceptual
+# hashes stay within a few bits of each other, so the old analysis is reused.
+DEDUPE_THRESHOLD = int(os.getenv("IMAGE_DEDUPE_THRESHOLD", "10"))   # bits of 64
+DEDUPE_MAX_PER_USER = int(os.getenv("IMAGE_DEDUPE_MAX_PER_USER", "50"))
+DEDUPE_TTL = int(os.getenv("IMAGE_DEDUPE_TTL", str(7 * 24 * 3600)))
+# guests are indexed per session, so owners keep arriving on a long-running
+# worker: cap the whole index and sweep expired entries now and then
+DEDUPE_MAX_ENTRIES = int(os.getenv("IMAGE_DEDUPE_MAX_ENTRIES", "5000"))
+DEDUPE_SWEEP_INTERVAL = int(os.getenv("IMAGE_DEDUPE_SWEEP_INTERVAL", "600"))
+
+
+# ================= PERCEPTUAL HASHES =================
+def _bits_to_int(bits):
+    return int.from_bytes(np.packbits(bits.astype(np.uint8).ravel()).tobytes(), "big")
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT_32 = _dct_matrix(32)
+
+
+def _gray(image, size):
+    return np.asarray(image.resize(size, Image.LANCZOS), dtype=np.float64)
+
+
+def average_hash(gray_image):
+    pixels = _gray(gray_image, (8, 8))
+    return _bits_to_int(pixels > pixels.mean())
+
+
+def difference_hash(gray_image):
+    pixels = _gray(gray_image, (9, 8))
+    return _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+
+
+def perceptual_hash(gray_image):
+    pixels = _gray(gray_image, (32, 32))
+    dct = _DCT_32 @ pixels @ _DCT_32.T
+    low = dct[:8, :8]
+    # skip the DC term when picking the median, it dwarfs the rest
+    return _bits_to_int(low > np.median(low.ravel()[1:]))
+
+
+def image_hashes(image_bytes):
+    gray = Image.open(io.BytesIO(image_bytes)).convert("L")
+    return (average_hash(gray), difference_hash(gray), perceptual_hash(gray))
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+# ================= PER-USER INDEX =================
+class ImageIndex:
+    def __init__(self, threshold=DEDUPE_THRESHOLD, max_per_user=DEDUPE_MAX_PER_USER,
+                 max_entries=DEDUPE_MAX_ENTRIES, sweep_interval=DEDUPE_SWEEP_INTERVAL):
+        self.threshold = threshold
+        self.max_per_user = max_per_user
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        # (owner, scope) -> list of [hashes, expires_at, text], least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        self._swept_at = time.monotonic()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def find(self, owner, scope, hashes):
+        now = time.time()
+
+        with self._lock:
+            key = (owner, scope)
+            entries = self._entries.get(key)
+            if entries:
+                self._drop_expired(key, entries, now)
+
+            if not entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+
+            # all three hashes must agree - any single 64-bit hash collides
+            # too easily on plain plates / skin close-ups
+            stored = np.array([e[0] for e in entries], dtype=np.uint64)
+            query = np.array(hashes, dtype=np.uint64)
+            distances = np.unpackbits((stored ^ query).view(np.uint8), axis=1).reshape(
+                len(entries), 3, 64
+            ).sum(axis=2)
+
+            worst = distances.max(axis=1)
+            best = int(worst.argmin())
+            if worst[best] > self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entries[best][2]
+
+    def add(self, owner, scope, hashes, text, ttl=DEDUPE_TTL):
+        now = time.time()
+
+        with self._lock:
+            key = (owner, scope)
+            entries = self._entries.setdefault(key, [])
+            self._entries.move_to_end(key)
+            entries.append([tuple(hashes), now + ttl, text])
+            self._size += 1
+            if len(entries) > self.max_per_user:
+                self._size -= len(entries) - self.max_per_user
+                del entries[:-self.max_per_user]
+
+            if time.monotonic() - self._swept_at >= self.sweep_interval:
+                self._sweep(now)
+
+            # evict whole least recently used owners / scopes
+            while self._size > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += len(evicted)
+
+    def _drop_expired(self, key, entries, now):
+        live = [e for e in entries if e[1] >= now]
+        if len(live) == len(entries):
+            return
+        self._size -= len(entries) - len(live)
+        self.expired += len(entries) - len(live)
+        entries[:] = live
+        if not live:
+            del self._entries[key]
+
+    def _sweep(self, now):
+        for key, entries in list(self._entries.items()):
+            self._drop_expired(key, entries, now)
+        self._swept_at = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "images": self._size,
+                "owners": len({owner for owner, _ in self._entries}),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# Shared by every Streamlit session in this process.
+image_index = ImageIndex(DEDUPE_THRESHOLD, DEDUPE_MAX_PER_USER)
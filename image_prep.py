@@ -0,0 +1,130 @@
+import io
+import os
+import threading
+
+from PIL import Image, ImageOps
+
+
+# ================= IMAGE PREP CONFIG =================
+# Phone photos (8-12 MB, 4000px+) are shrunk before they go to Gemini;
+# the model doesn't need more than ~1.5k px to read a plate or a rash.
+IMAGE_MAX_EDGE = int(os.getenv("IMAGE_MAX_EDGE", "1536"))
+IMAGE_FORMAT = os.getenv("IMAGE_FORMAT", "JPEG").upper()    # JPEG or WEBP
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "85"))
+
+MIME_TYPES = {"JPEG": "image/jpeg", "WEBP": "image/webp"}
+
+
+class PreparedImage:
+    def __init__(self, data, mime_type, original_bytes, size, original_size):
+        self.data = data
+        self.mime_type = mime_type
+        self.original_bytes = original_bytes
+        self.size = size                    # (width, height) sent
+        self.original_size = original_size  # (width, height) uploaded
+
+    @property
+    def saved_ratio(self):
+        if not self.original_bytes:
+            return 0.0
+        return 1 - len(self.data) / self.original_bytes
+
+    def summary(self):
+        return (
+            f"{_fmt_bytes(self.original_bytes)} → {_fmt_bytes(len(self.data))} "
+            f"({self.saved_ratio:.0%} smaller, "
+            f"{self.original_size[0]}×{self.original_size[1]} → {self.size[0]}×{self.size[1]})"
+        )
+
+
+def _fmt_bytes(n):
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.1f} MB"
+    return f"{n / 1024:.0f} KB"
+
+
+def _as_buffer(source):
+    # UploadedFile is a BytesIO: getbuffer() is a view of its memory, no copy
+    if hasattr(source, "getbuffer"):
+        return source.getbuffer()
+    return memoryview(source)
+
+
+def _open(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+        return Image.open(source)
+    # BytesIO over a bytes object shares it until written to
+    return Image.open(io.BytesIO(source))
+
+
+# ================= PIPELINE =================
+def preprocess_image(source, max_edge=IMAGE_MAX_EDGE, fmt=IMAGE_FORMAT, quality=IMAGE_QUALITY):
+    # decode once -> fix EXIF rotation -> downsize -> re-encode without metadata
+    buffer = _as_buffer(source)
+    original_bytes = buffer.nbytes
+    # the view pins the upload's memory (a BytesIO can't grow or be freed while
+    # it exists), so it is released even when decoding fails
+    try:
+        image = _open(source)
+        original_size = image.size
+        original_mime = Image.MIME.get(image.format)
+        has_exif = bool(image.getexif())
+
+        # JPEG can decode straight at 1/2, 1/4 or 1/8 scale - much cheaper than
+        # decoding 12 MP and throwing most of it away
+        image.draft("RGB", (max_edge, max_edge))
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+        if fmt == "JPEG" and image.mode != "RGB":
+            if image.mode in ("RGBA", "LA", "P"):
+                image = image.convert("RGBA")
+                background = Image.new("RGB", image.size, "white")
+                background.paste(image, mask=image.getchannel("A"))
+                image = background
+            else:
+                image = image.convert("RGB")
+
+        out = io.BytesIO()
+        # no exif= / icc_profile= -> metadata (GPS, camera serial...) is dropped
+        image.save(out, format=fmt, quality=quality, optimize=True)
+
+        if out.tell() >= original_bytes and image.size == original_size and not has_exif and original_mime:
+            # already small (icons, screenshots): re-encoding only made it bigger
+            prepared = PreparedImage(bytes(buffer), original_mime, original_bytes, image.size, original_size)
+        else:
+            prepared = PreparedImage(out.getvalue(), MIME_TYPES[fmt], original_bytes, image.size, original_size)
+    finally:
+        buffer.release()
+
+    image_stats.record(prepared)
+    return prepared
+
+
+# ================= SAVINGS COUNTERS =================
+class ImageStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.images = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def record(self, prepared):
+        with self._lock:
+            self.images += 1
+            self.bytes_in += prepared.original_bytes
+            self.bytes_out += len(prepared.data)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "images": self.images,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "saved_ratio": round(1 - self.bytes_out / self.bytes_in, 3) if self.bytes_in else 0.0,
+            }
+
+
+# Shared by every Streamlit session in this process.
+image_stats = ImageStats()
@@ -0,0 +1,164 @@
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import tempfile
+
+
+# ================= IMPORT-TIME BUDGET =================
+# Measures what a fresh worker pays to import the app before the first
+# rerun can start:
+#
+#   python import_budget.py                  # report + check IMPORT_BUDGET_MS
+#   python import_budget.py --budget 900 --top 30 --runs 5
+#
+# Runs `python -X importtime` over the top-level imports of Nutrition1.py
+# (not the script itself, which would start rendering), prints the slowest
+# modules and exits 1 if the total is over budget or a feature-only package
+# was imported eagerly. Module-level setup code can import them too, so the
+# script is also run once with AppTest and sys.modules checked afterwards.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = os.path.join(APP_DIR, "Nutrition1.py")
+
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1000"))
+
+# must only load when their feature runs (lazy_imports.LazyModule)
+LAZY_ONLY = (
+    "matplotlib", "reportlab", "speech_recognition", "gtts",
+    "cv2", "av", "streamlit_webrtc", "google_auth_oauthlib",
+)
+
+
+def startup_imports(script=APP_SCRIPT):
+    with open(script, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [
+        ast.unparse(node) for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+
+
+def parse_importtime(stderr):
+    # "import time:  self [us] | cumulative | imported package"
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(self_us), int(cumulative), depth, name.strip()))
+    return rows
+
+
+# first full run of the default page, then the loaded modules
+FIRST_RUN = """
+import sys
+from streamlit.testing.v1 import AppTest
+
+at = AppTest.from_file({script!r}, default_timeout=120)
+at.run()
+if at.exception:
+    sys.exit("first run failed: " + at.exception[0].value)
+print("MODULES", " ".join(sys.modules))
+"""
+
+
+def _env():
+    return dict(
+        os.environ,
+        PYTHONPATH=APP_DIR,
+        AI_BACKEND="fake",
+        LLM_METRICS_PORT="0",
+    )
+
+
+def measure(imports, runs=3):
+    code = "\n".join(imports)
+    env = _env()
+
+    best = None
+    # module singletons create their db / cache files in the working dir
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(runs):
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", code],
+                cwd=workdir, env=env, capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                raise RuntimeError(f"import failed:\n{proc.stderr[-2000:]}")
+
+            rows = parse_importtime(proc.stderr)
+            total = sum(cum for _, cum, depth, _ in rows if depth == 0)
+            if best is None or total < best[0]:
+                best = (total, rows)
+    return best
+
+
+def first_run_imports(script=APP_SCRIPT):
+    with tempfile.TemporaryDirectory() as workdir:
+        proc = subprocess.run(
+            [sys.executable, "-c", FIRST_RUN.format(script=script)],
+            cwd=workdir, env=_env(), capture_output=True, text=True,
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"first run failed:\n{proc.stderr[-2000:]}")
+
+    line = next(l for l in proc.stdout.splitlines() if l.startswith("MODULES "))
+    return feature_packages(line.split()[1:])
+
+
+def feature_packages(modules):
+    found = []
+    for name in modules:
+        root = name.split(".")[0]
+        if root in LAZY_ONLY and root not in found:
+            found.append(root)
+    return found
+
+
+def eager_feature_imports(rows):
+    return feature_packages(name for _, _, _, name in rows)
+
+
+def report(total_us, rows, budget_ms, top, first_run=()):
+    total_ms = total_us / 1000
+    print(f"Startup imports: {total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    print(f"{'ms':>8}  module")
+    for _, cumulative, _, name in sorted(
+        (r for r in rows if r[2] == 0), key=lambda r: r[1], reverse=True
+    )[:top]:
+        print(f"{cumulative / 1000:8.1f}  {name}")
+
+    failed = False
+    if total_ms > budget_ms:
+        print(f"\nOVER BUDGET by {total_ms - budget_ms:.0f} ms")
+        failed = True
+
+    eager = eager_feature_imports(rows)
+    if eager:
+        print(f"\nFeature-only packages imported at startup: {', '.join(eager)}")
+        failed = True
+
+    if first_run:
+        print(f"\nFeature-only packages imported by the first script run: {', '.join(first_run)}")
+        failed = True
+
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the app's import time against a budget")
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_MS, help="ms")
+    parser.add_argument("--runs", type=int, default=3, help="best of N cold imports")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    total_us, rows = measure(startup_imports(), args.runs)
+    first_run = first_run_imports()
+    sys.exit(1 if report(total_us, rows, args.budget, args.top, first_run) else 0)
+
+
+if __name__ == "__main__":
+    main()
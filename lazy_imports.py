@@ -0,0 +1,38 @@
+import importlib
+
+
+# ================= LAZY IMPORTS =================
+# Feature-only packages (speech, TTS, PDF) cost hundreds of ms
+# and tens of MB per worker at startup. A LazyModule stands in for the
+# module and imports it on first attribute access / call, so only the
+# sessions that use the feature pay for it.
+class LazyModule:
+    def __init__(self, name, attr=None):
+        self._name = name
+        self._attr = attr
+        self._target = None
+
+    def _load(self):
+        if self._target is None:
+            module = importlib.import_module(self._name)
+            self._target = getattr(module, self._attr) if self._attr else module
+        return self._target
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        target = f"{self._name}.{self._attr}" if self._attr else self._name
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {target} ({state})>"
+
+
+def lazy_module(name):
+    return LazyModule(name)
+
+
+def lazy_attr(module, attr):
+    return LazyModule(module, attr)
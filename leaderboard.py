@@ -0,0 +1,172 @@
+import bisect
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+
+# ================= LEADERBOARD CONFIG =================
+# Aggregates are refreshed from the store this often, to pick up records
+# written by other server processes; a refresh only re-reads the days since
+# the previous one. Saves in this process apply instantly.
+LEADERBOARD_REFRESH = float(os.getenv("LEADERBOARD_REFRESH", "300"))
+PAGE_SIZE = 20
+
+
+class _UserStats:
+    def __init__(self, name):
+        self.name = name           # display name of the latest entry
+        self.entries = 0
+        self.last_date = None
+        self.latest_weight = None
+        self.days = {}             # day -> entries that day
+        self.streak = 0
+
+    def set_day(self, day, entries, last_date, weight, name):
+        # a day's totals as the store reports them; re-reading a day that
+        # save() already counted replaces it instead of adding it twice
+        self.entries += entries - self.days.get(day, 0)
+        new_day = day not in self.days
+        self.days[day] = entries
+
+        if self.last_date is None or last_date >= self.last_date:
+            self.last_date = last_date
+            self.name = name
+            if weight is not None:
+                self.latest_weight = weight
+
+        if new_day:
+            self.streak = _streak(self.days)
+
+    def key(self, user_id):
+        # sort order of the index: most entries first, then by name
+        return (-self.entries, self.name, user_id)
+
+
+def _streak(days):
+    # consecutive days with an entry, counting back from the latest one
+    day = max(days)
+    streak = 0
+    while day in days:
+        streak += 1
+        day -= timedelta(days=1)
+    return streak
+
+
+# ================= MATERIALIZED LEADERBOARD =================
+# Users are keyed by UserId (the hashed account, see identity.public_id);
+# rows saved before it existed fall back to their display name.
+class LeaderboardIndex:
+    def __init__(self, refresh=LEADERBOARD_REFRESH):
+        self.refresh = refresh
+        self._lock = threading.Lock()          # guards the aggregates
+        self._write_lock = threading.Lock()    # a save and a refresh never interleave
+        self._users = {}    # user id -> _UserStats
+        self._order = []    # sorted [(-entries, name, user id)]
+        self._loaded_at = None
+        self._since = None  # first day the next refresh re-reads
+
+    # ---------------- BUILD / REFRESH ----------------
+    def ensure_loaded(self, store):
+        with self._lock:
+            fresh = self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh
+        if not fresh:
+            self.rebuild(store)
+
+    def rebuild(self, store):
+        # First call: every (user, day) summary. Later calls only re-read the
+        # days since the previous refresh (records from other processes) and
+        # replace those days; a day of overlap covers saves queued across
+        # midnight.
+        with self._write_lock:
+            since = self._since
+            today = date.today()
+            rows = store.daily_summary(since)
+
+            with self._lock:
+                if since is None:
+                    self._users, self._order = {}, []
+                for row in rows.itertuples(index=False):
+                    last_date = pd.to_datetime(row.LastDate, errors="coerce")
+                    if pd.isna(last_date):
+                        continue   # hand-edited / corrupt row
+
+                    weight = None if pd.isna(row.LastWeight) else float(row.LastWeight)
+                    self._set_day(row.UserId, last_date.date(), int(row.Entries), last_date, weight, row.Username)
+
+                self._loaded_at = time.monotonic()
+                self._since = today - timedelta(days=1)
+
+    # ---------------- INCREMENTAL UPDATE (called by save_data) ----------------
+    def save(self, store, record):
+        # the store write and the index update happen under the lock a
+        # refresh holds, so a refresh sees a record either in the store
+        # (and sets its day) or not at all (and it is added after)
+        with self._write_lock:
+            store.add(record)
+            when = pd.Timestamp(record["Date"])
+            user_id = record.get("UserId") or record["Username"]
+
+            with self._lock:
+                if self._loaded_at is None:
+                    return   # not built yet; the first rebuild will include it
+                stats = self._users.get(user_id)
+                day = when.date()
+                entries = (stats.days.get(day, 0) if stats else 0) + 1
+                self._set_day(user_id, day, entries, when, record.get("Weight"), record["Username"])
+
+    def _set_day(self, user_id, day, entries, last_date, weight, name):
+        # caller holds self._lock
+        stats = self._users.get(user_id)
+        if stats is None:
+            stats = self._users[user_id] = _UserStats(name)
+        elif stats.days:
+            self._order.pop(bisect.bisect_left(self._order, stats.key(user_id)))
+
+        stats.set_day(day, entries, last_date, weight, name)
+        bisect.insort(self._order, stats.key(user_id))
+
+    # ---------------- QUERIES ----------------
+    def __len__(self):
+        with self._lock:
+            return len(self._order)
+
+    def page(self, page=0, size=PAGE_SIZE):
+        # O(size): slice of the sorted index, independent of record count
+        with self._lock:
+            start = page * size
+            keys = self._order[start:start + size]
+            rows = [self._row(start + i + 1, user_id) for i, (_, _, user_id) in enumerate(keys)]
+
+        return pd.DataFrame(
+            rows,
+            columns=["Rank", "Username", "Entries Logged", "Last Entry", "Latest Weight", "Streak"]
+        )
+
+    def top(self, k=3):
+        return self.page(0, k)
+
+    def _row(self, rank, user_id):
+        s = self._users[user_id]
+        last = s.last_date.strftime("%Y-%m-%d") if s.last_date is not None else ""
+        # nothing logged today or yesterday -> the streak is broken
+        alive = s.days and max(s.days) >= date.today() - timedelta(days=1)
+        return [rank, s.name, s.entries, last, s.latest_weight, s.streak if alive else 0]
+
+    def summary(self):
+        with self._lock:
+            weights = [s.latest_weight for s in self._users.values() if s.latest_weight is not None]
+            return {
+                "users": len(self._users),
+                "entries": sum(s.entries for s in self._users.values()),
+                "avg_latest_weight": round(sum(weights) / len(weights), 1) if weights else None,
+            }
+
+    def pages(self, size=PAGE_SIZE):
+        return max(1, -(-len(self) // size))
+
+
+# Shared by every Streamlit session in this process.
+leaderboard_index = LeaderboardIndex(LEADERBOARD_REFRESH)
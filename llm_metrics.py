@@ -0,0 +1,250 @@
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from history_digest import CHARS_PER_TOKEN
+
+
+# ================= METRICS CONFIG =================
+# Prometheus text format on http://127.0.0.1:9464/metrics
+# LLM_METRICS_PORT=0 turns the endpoint off.
+METRICS_PORT = int(os.getenv("LLM_METRICS_PORT", "9464"))
+METRICS_HOST = os.getenv("LLM_METRICS_HOST", "127.0.0.1")
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, math.inf)
+
+# outcomes that are not errors; "coalesced" = answered by another session's call
+SERVED = ("ok", "cache_hit", "coalesced")
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(chars):
+    return (chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def usage_from_response(response):
+    # (prompt tokens, response tokens) as billed by Gemini, if reported
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return None
+    return (
+        getattr(usage, "prompt_token_count", 0) or 0,
+        getattr(usage, "candidates_token_count", 0) or 0,
+    )
+
+
+# ================= PER-FEATURE COUNTERS =================
+class _FeatureStats:
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.outcomes = {}   # "ok" / "cache_hit" / error kind -> count
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+        self.prompt_chars = 0
+        self.response_chars = 0
+        self.prompt_tokens = 0
+        self.response_tokens = 0
+
+    def quantile(self, q):
+        # upper bound of the bucket holding the q-th call, like
+        # histogram_quantile without interpolation; calls in the +Inf bucket
+        # report the largest finite bound
+        target = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= target and count:
+                return min(bound, LATENCY_BUCKETS[-2])
+        return 0.0
+
+
+class _Call:
+    def __init__(self, metrics, feature, prompt):
+        self.metrics = metrics
+        self.feature = feature
+        self.prompt_chars = len(prompt)
+        self.start = time.perf_counter()
+
+    def done(self, result, cache_hit=False, usage=None, coalesced=False):
+        ok = getattr(result, "ok", True)
+        response_chars = len(result) if ok else 0
+
+        if cache_hit or coalesced or not ok:
+            tokens = (0, 0)   # nothing billed upstream for this session
+        elif usage:
+            tokens = usage
+        else:
+            tokens = (estimate_tokens(self.prompt_chars), estimate_tokens(response_chars))
+
+        self.metrics.record(
+            self.feature,
+            time.perf_counter() - self.start,
+            self.prompt_chars,
+            response_chars,
+            tokens,
+            "cache_hit" if cache_hit else "coalesced" if coalesced else "ok" if ok else result.kind,
+        )
+        return result
+
+
+class LLMMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._features = {}   # feature -> _FeatureStats
+        self._gauges = {}     # name -> (help, fn)
+
+    def start(self, feature, prompt):
+        return _Call(self, feature, prompt)
+
+    def record(self, feature, seconds, prompt_chars, response_chars, tokens, outcome):
+        with self._lock:
+            stats = self._features.setdefault(feature, _FeatureStats())
+            stats.calls += 1
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+            if outcome == "cache_hit":
+                stats.cache_hits += 1
+
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats.buckets[i] += 1
+                    break
+            stats.latency_sum += seconds
+
+            stats.prompt_chars += prompt_chars
+            stats.response_chars += response_chars
+            stats.prompt_tokens += tokens[0]
+            stats.response_tokens += tokens[1]
+
+    def gauge(self, name, help_text, fn):
+        # fn() is read at scrape time; registering the same name again replaces it
+        with self._lock:
+            self._gauges[name] = (help_text, fn)
+
+    def reset(self):
+        with self._lock:
+            self._features.clear()
+
+    def summary(self):
+        rows = []
+        with self._lock:
+            for feature, s in sorted(self._features.items()):
+                errors = s.calls - sum(s.outcomes.get(kind, 0) for kind in SERVED)
+                rows.append({
+                    "feature": feature,
+                    "calls": s.calls,
+                    "cache_hit_rate": round(s.cache_hits / s.calls, 3),
+                    "errors": errors,
+                    "error_kinds": ", ".join(
+                        f"{kind} {n}" for kind, n in s.outcomes.items()
+                        if kind not in SERVED
+                    ),
+                    "avg_ms": round(s.latency_sum / s.calls * 1000),
+                    "p50_ms": s.quantile(0.5) * 1000,
+                    "p95_ms": s.quantile(0.95) * 1000,
+                    "avg_prompt_tokens": round(s.prompt_tokens / s.calls),
+                    "avg_response_tokens": round(s.response_tokens / s.calls),
+                })
+        return rows
+
+    # ---------------- PROMETHEUS TEXT FORMAT ----------------
+    def render_prometheus(self):
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            features = sorted(self._features.items())
+            gauges = sorted(self._gauges.items())
+
+            header("llm_requests_total", "counter", "LLM requests by feature and outcome")
+            for feature, s in features:
+                for outcome, n in sorted(s.outcomes.items()):
+                    lines.append(f'llm_requests_total{{feature="{feature}",outcome="{outcome}"}} {n}')
+
+            header("llm_request_duration_seconds", "histogram", "End-to-end LLM request latency")
+            for feature, s in features:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, s.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else bound
+                    lines.append(
+                        f'llm_request_duration_seconds_bucket{{feature="{feature}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(f'llm_request_duration_seconds_sum{{feature="{feature}"}} {s.latency_sum:.6f}')
+                lines.append(f'llm_request_duration_seconds_count{{feature="{feature}"}} {s.calls}')
+
+            for name, attr, help_text in (
+                ("llm_prompt_chars_total", "prompt_chars", "Prompt characters sent"),
+                ("llm_response_chars_total", "response_chars", "Response characters received"),
+                ("llm_prompt_tokens_total", "prompt_tokens", "Prompt tokens billed upstream"),
+                ("llm_response_tokens_total", "response_tokens", "Response tokens billed upstream"),
+            ):
+                header(name, "counter", help_text)
+                for feature, s in features:
+                    lines.append(f'{name}{{feature="{feature}"}} {getattr(s, attr)}')
+
+        for name, (help_text, fn) in gauges:
+            try:
+                value = float(fn())
+            except Exception:
+                continue
+            header(name, "gauge", help_text)
+            lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+# One registry per process, shared by every Streamlit session.
+llm_metrics = LLMMetrics()
+
+
+# ================= /metrics ENDPOINT =================
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = llm_metrics.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=METRICS_PORT, host=METRICS_HOST):
+    # Safe to call on every rerun: only the first call starts the server.
+    global _server
+    if not port:
+        return None
+
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                # port taken (e.g. another replica on this host) -> run without it
+                logger.warning("LLM metrics endpoint disabled: %s", e)
+                _server = False
+                return None
+
+            threading.Thread(
+                target=_server.serve_forever, name="llm-metrics", daemon=True
+            ).start()
+
+    return _server or None
@@ -0,0 +1,290 @@
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+
+# ================= LOAD TEST =================
+# Starts the app with the local fake Gemini backend (no API key, no network)
+# and simulates N concurrent browser sessions over Streamlit's websocket
+# protocol, clicking through the pages:
+#
+#   python load_test.py --sessions 20 --duration 60
+#   python load_test.py --latency uniform:0.2,1.5 --error-rate 0.05
+#   python load_test.py --url http://localhost:8501   (already running server)
+#
+# Reports end-to-end rerun latency (click -> script finished) p50/p95/p99,
+# throughput and the websocket bytes the server sends per rerun.
+# Needs the dev requirements: pip install -r requirements-dev.txt
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_SCRIPT = os.path.join(APP_DIR, "Nutrition1.py")
+
+# (button label, button key, page) - key is used when a label appears more
+# than once; the session navigates to the page first if it's elsewhere
+SCENARIO = [
+    ("➕ Drink 1 Glass", "add_water", "Water Tracker"),
+    ("💾 Save Mood", "save_mood", "Mood Tracker"),
+    ("💾 Save Sleep", "save_sleep", "Sleep"),
+    ("💾 Save Weight", "save_weight", "BMI & Fitness"),
+    ("✅ Log Healthy Day", "streak_log_1", "Streak"),
+    ("⚡ Get Health Tips", None, "Next-Gen AI Health (Voice + Camera + Smart AI)"),
+    ("⚡ Run Quick Scan", None, "Voice AI"),
+    ("🚀 Generate Personalized Meal Plan", None, "Meal Planning"),
+    ("🧠 Analyze My Health Risks", "risk_btn", "AI Risk Analysis"),
+    ("🔍 Analyze Sleep Pattern", "sleep_ai", "Sleep"),
+    ("🔍 Analyze My Habits", "habit_btn", "Dashboard"),
+]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LoadResult:
+    def __init__(self):
+        self.latencies = []
+        self.payloads = []      # bytes received per rerun
+        self.by_action = {}
+        self.errors = 0
+        self.missing = 0
+
+    def record(self, action, elapsed, failed, payload=0):
+        self.latencies.append(elapsed)
+        self.payloads.append(payload)
+        self.by_action.setdefault(action, []).append(elapsed)
+        if failed:
+            self.errors += 1
+
+
+# ================= ONE BROWSER SESSION =================
+class Session:
+    def __init__(self, ws):
+        self.ws = ws
+        self.page_script_hash = ""
+        self.pages = {}     # page title -> page_script_hash (from st.navigation)
+        self.buttons = {}   # widget id -> (label, fragment id)
+        self.last_payload = 0
+
+    async def rerun(self, widget_states=None, fragment_id=""):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = self.page_script_hash
+        # st.fragment widgets rerun only their fragment, as in the browser
+        msg.rerun_script.fragment_id = fragment_id
+        for state in widget_states or []:
+            msg.rerun_script.widget_states.widgets.append(state)
+
+        await self.ws.send(msg.SerializeToString())
+
+        buttons = {}
+        failed = False
+        payload = 0
+
+        while True:
+            data = await self.ws.recv()
+            payload += len(data)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            kind = fwd.WhichOneof("type")
+
+            if kind == "new_session":
+                self.page_script_hash = fwd.new_session.page_script_hash
+            elif kind == "navigation":
+                self.page_script_hash = fwd.navigation.page_script_hash
+                self.pages = {p.page_name: p.page_script_hash for p in fwd.navigation.app_pages}
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "button":
+                    buttons[element.button.id] = (element.button.label, fwd.delta.fragment_id)
+                elif element_type == "exception":
+                    failed = True
+            elif kind == "script_finished":
+                status = fwd.script_finished
+                if status == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                if status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    failed = True
+                if status == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+                    # only the fragment's own elements were resent
+                    buttons = {
+                        **{k: v for k, v in self.buttons.items() if v[1] != fragment_id},
+                        **buttons,
+                    }
+                break
+
+        self.buttons = buttons
+        self.last_payload = payload
+        return failed
+
+    def find_button(self, label, key):
+        for widget_id, (button_label, _) in self.buttons.items():
+            if key is not None and widget_id.endswith("-" + key):
+                return widget_id
+            if key is None and button_label == label:
+                return widget_id
+        return None
+
+    async def open_page(self, page):
+        self.page_script_hash = self.pages.get(page, self.page_script_hash)
+        return await self.rerun()
+
+    async def click(self, widget_id):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        state = WidgetState(id=widget_id, trigger_value=True)
+        return await self.rerun([state], self.buttons[widget_id][1])
+
+
+async def run_session(url, session_no, deadline, think_time, result):
+    import websockets
+
+    rng = random.Random(session_no)
+    ws_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+
+    async with websockets.connect(ws_url, subprotocols=["streamlit"],
+                                  max_size=None) as ws:
+        session = Session(ws)
+
+        start = time.perf_counter()
+        failed = await session.rerun()
+        result.record("initial load", time.perf_counter() - start, failed, session.last_payload)
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(rng.uniform(0, think_time))
+
+            label, key, page = rng.choice(SCENARIO)
+            if session.pages.get(page, session.page_script_hash) != session.page_script_hash:
+                start = time.perf_counter()
+                failed = await session.open_page(page)
+                result.record("open page", time.perf_counter() - start, failed, session.last_payload)
+
+            widget_id = session.find_button(label, key)
+            if widget_id is None:
+                # not rendered in the current state of the page
+                result.missing += 1
+                continue
+
+            start = time.perf_counter()
+            failed = await session.click(widget_id)
+            result.record(label, time.perf_counter() - start, failed, session.last_payload)
+
+
+# ================= LOCAL SERVER =================
+def start_server(port, args):
+    env = dict(os.environ)
+    env["AI_BACKEND"] = "fake"
+    if args.latency:
+        env["FAKE_AI_LATENCY"] = args.latency
+    if args.error_rate is not None:
+        env["FAKE_AI_ERROR_RATE"] = str(args.error_rate)
+
+    # run from a scratch directory so CSV/PDF output doesn't touch the repo
+    cwd = APP_DIR if args.keep_data else tempfile.mkdtemp(prefix="health_load_")
+
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", APP_SCRIPT,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--browser.gatherUsageStats", "false",
+            # runs outside the app dir, so .streamlit/config.toml isn't read
+            "--server.enableStaticServing", "true",
+        ],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    url = f"http://localhost:{port}"
+    for _ in range(120):
+        try:
+            urllib.request.urlopen(url + "/_stcore/health", timeout=1)
+            return server, url
+        except OSError:
+            time.sleep(0.5)
+
+    server.terminate()
+    raise RuntimeError("Streamlit server did not start")
+
+
+def print_report(result, sessions, wall):
+    lat = result.latencies
+    print(f"\nSessions: {sessions}   Wall time: {wall:.1f}s")
+    print(f"Reruns: {len(lat)}   Throughput: {len(lat) / wall:.2f} reruns/s")
+    print(f"Errors: {result.errors}   Skipped (button not on page): {result.missing}")
+    if result.payloads:
+        print(
+            f"Payload per rerun  avg {sum(result.payloads) / len(result.payloads) / 1024:.1f} KB   "
+            f"p50 {percentile(result.payloads, 50) / 1024:.1f} KB"
+        )
+    print(
+        f"Rerun latency  p50 {percentile(lat, 50) * 1000:.0f} ms   "
+        f"p95 {percentile(lat, 95) * 1000:.0f} ms   "
+        f"p99 {percentile(lat, 99) * 1000:.0f} ms"
+    )
+
+    print(f"\n{'Action':<40}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for label, values in sorted(result.by_action.items()):
+        print(
+            f"{label:<40}{len(values):>6}"
+            f"{percentile(values, 50) * 1000:>10.0f}"
+            f"{percentile(values, 95) * 1000:>10.0f}"
+            f"{percentile(values, 99) * 1000:>10.0f}"
+        )
+
+
+async def run_load(url, args):
+    result = LoadResult()
+    deadline = time.monotonic() + args.duration
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_session(url, n, deadline, args.think, result)
+        for n in range(args.sessions)
+    ))
+    print_report(result, args.sessions, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the AI Health Companion")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--think", type=float, default=1.0, help="max think time between clicks")
+    parser.add_argument("--url", default=None, help="use an already running server")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--latency", default=None, help="FAKE_AI_LATENCY spec")
+    parser.add_argument("--error-rate", type=float, default=None)
+    parser.add_argument("--keep-data", action="store_true",
+                        help="write CSV/PDF files into the app directory")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        server, url = start_server(args.port, args)
+
+    try:
+        asyncio.run(run_load(url, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import math
+import re
+import os
+import random
+import threading
+import time
+
+
+# ================= BACKEND CONFIG =================
+# AI_BACKEND=gemini -> real google.generativeai model (needs GOOGLE_API_KEY)
+# AI_BACKEND=fake   -> local stand-in, no key and no network
+AI_BACKEND = os.getenv("AI_BACKEND", "gemini").lower()
+
+# Latency spec: "0.8", "fixed:0.8", "uniform:0.2,1.5", "normal:1.0,0.3",
+# "lognormal:1.0,0.5" (median seconds, sigma)
+FAKE_LATENCY = os.getenv("FAKE_AI_LATENCY", "lognormal:1.0,0.5")
+FAKE_ERROR_RATE = float(os.getenv("FAKE_AI_ERROR_RATE", "0"))
+FAKE_CHUNK_CHARS = int(os.getenv("FAKE_AI_CHUNK_CHARS", "40"))
+FAKE_CHUNK_DELAY = float(os.getenv("FAKE_AI_CHUNK_DELAY", "0.05"))
+FAKE_SEED = os.getenv("FAKE_AI_SEED")
+
+
+def use_fake_backend():
+    return AI_BACKEND == "fake"
+
+
+def parse_latency(spec):
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+
+    values = [float(v) for v in args.split(",")]
+
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+# ================= FAKE GEMINI =================
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+        self.parts = [text] if text else []
+
+
+CANNED_RESPONSES = [
+    # (keyword in prompt, response)
+    ("detect mood", "happy"),
+    ("classify mood", "normal"),
+    ("meal plan", (
+        "## 🥗 7-Day Meal Plan (demo)\n\n"
+        "**Day 1** – Oats with fruit · Dal, rice & salad · Paneer tikka · Nuts\n\n"
+        "**Day 2** – Poha · Rajma & roti · Grilled veggies · Yogurt\n\n"
+        "### 🛒 Shopping List\n- Oats\n- Lentils\n- Seasonal vegetables\n"
+    )),
+    ("health tips", (
+        "1. 💧 Drink 8 glasses of water\n2. 🥗 Add one vegetable to every meal\n"
+        "3. 😴 Sleep 7–8 hours\n4. 🏃 Walk 30 minutes\n5. 🧘 Breathe deeply for 5 minutes\n"
+    )),
+]
+
+
+class FakeGenerativeModel:
+    def __init__(self, model_name, latency=FAKE_LATENCY, error_rate=FAKE_ERROR_RATE,
+                 chunk_chars=FAKE_CHUNK_CHARS, chunk_delay=FAKE_CHUNK_DELAY,
+                 seed=FAKE_SEED):
+        self.model_name = model_name
+        self.error_rate = error_rate
+        self.chunk_chars = chunk_chars
+        self.chunk_delay = chunk_delay
+        self._latency = parse_latency(latency)
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def generate_content(self, contents, stream=False, request_options=None, **kwargs):
+        prompt = self._prompt_text(contents)
+        has_image = isinstance(contents, list) and len(contents) > 1
+
+        with self._rng_lock:
+            delay = self._latency(self._rng)
+            fail = self._rng.random() < self.error_rate
+        time.sleep(delay)
+
+        if fail:
+            from google.api_core import exceptions
+            raise exceptions.ServiceUnavailable("Fake backend: simulated upstream error")
+
+        if self._wants_json(kwargs.get("generation_config")):
+            text = self._render_json(prompt)
+        else:
+            text = self._render(prompt, has_image)
+
+        if stream:
+            return self._stream(text)
+        return FakeResponse(text)
+
+    def _stream(self, text):
+        for i in range(0, len(text), self.chunk_chars):
+            if i:
+                time.sleep(self.chunk_delay)
+            yield FakeResponse(text[i:i + self.chunk_chars])
+
+    def _prompt_text(self, contents):
+        if isinstance(contents, str):
+            return contents
+        return "\n".join(part for part in contents if isinstance(part, str))
+
+    def _wants_json(self, generation_config):
+        return (generation_config or {}).get("response_mime_type") == "application/json"
+
+    def _render_json(self, prompt):
+        # fill every "key": placeholder of the JSON template in the prompt
+        keys = re.findall(r'"([a-z_]+)"\s*:', prompt)
+        return json.dumps({
+            key: f"- Demo {key.replace('_', ' ')}: keep up water, sleep and activity.\n"
+                 "- This is a local stand-in, not real medical advice."
+            for key in dict.fromkeys(keys)
+        })
+
+    def _render(self, prompt, has_image):
+        lowered = prompt.lower()
+        for keyword, response in CANNED_RESPONSES:
+            if keyword in lowered:
+                return response
+
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        topic = next(
+            (line.strip() for line in prompt.splitlines()[1:] if line.strip()),
+            "your question"
+        )
+        source = "image + text" if has_image else "text"
+
+        return (
+            f"### 🤖 Demo AI response `{digest}`\n\n"
+            f"**About:** {topic[:120]}\n\n"
+            f"- Input: {source}, {len(prompt)} characters\n"
+            "- Stay hydrated, sleep well and keep moving.\n"
+            "- This is a local stand-in, not real medical advice.\n"
+        )
+
+
+# ================= FACTORY =================
+def create_model(model_name, api_key=None):
+    if use_fake_backend():
+        return FakeGenerativeModel(model_name)
+
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
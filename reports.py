@@ -0,0 +1,16 @@
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph
+
+
+# ================= PDF REPORTS =================
+# Imported lazily by the app: reportlab only loads when a report is built.
+def generate_pdf(text, file="health_report.pdf"):
+    doc = SimpleDocTemplate(file)
+    styles = getSampleStyleSheet()
+
+    content = []
+    for line in text.split("\n"):
+        content.append(Paragraph(line, styles["Normal"]))
+
+    doc.build(content)
+    return file
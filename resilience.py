@@ -0,0 +1,256 @@
+import os
+import random
+import threading
+import time
+
+from ai_executor import AICancelled, AITimeout
+
+
+# ================= RETRY / BREAKER CONFIG =================
+RETRY_ATTEMPTS = int(os.getenv("AI_RETRY_ATTEMPTS", "3"))
+BACKOFF_BASE = float(os.getenv("AI_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.getenv("AI_BACKOFF_MAX", "8"))
+BREAKER_THRESHOLD = int(os.getenv("AI_BREAKER_THRESHOLD", "5"))
+BREAKER_COOLDOWN = float(os.getenv("AI_BREAKER_COOLDOWN", "30"))
+# a retry needs at least this much of the caller's deadline left
+RETRY_MIN_TIMEOUT = float(os.getenv("AI_RETRY_MIN_TIMEOUT", "2"))
+
+
+# ================= ERROR CLASSES =================
+RATE_LIMIT = "rate_limit"
+TIMEOUT = "timeout"
+SERVER = "server"
+SAFETY = "safety_block"
+CANCELLED = "cancelled"
+CIRCUIT_OPEN = "circuit_open"
+OTHER = "error"
+
+RETRYABLE = {RATE_LIMIT, TIMEOUT, SERVER}
+
+ERROR_MESSAGES = {
+    RATE_LIMIT: "⏳ The AI service is busy right now. Please try again in a minute.",
+    TIMEOUT: "⌛ The AI took too long to respond. Please try again.",
+    SERVER: "🛠️ The AI service is having trouble. Please try again shortly.",
+    SAFETY: "🛡️ This request was blocked by the AI safety filter. Try rephrasing it.",
+    CANCELLED: "↩️ Request cancelled.",
+    CIRCUIT_OPEN: "🚧 AI is temporarily unavailable. Please try again in a little while.",
+}
+
+
+class SafetyBlocked(Exception):
+    pass
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+def classify_error(exc):
+    if isinstance(exc, CircuitOpen):
+        return CIRCUIT_OPEN
+    if isinstance(exc, AICancelled):
+        return CANCELLED
+    if isinstance(exc, (AITimeout, TimeoutError)):
+        return TIMEOUT
+    if isinstance(exc, SafetyBlocked):
+        return SAFETY
+
+    try:
+        from google.api_core import exceptions as api_errors
+        from google.generativeai.types import BlockedPromptException, StopCandidateException
+    except ImportError:
+        api_errors = None
+    else:
+        if isinstance(exc, (api_errors.ResourceExhausted, api_errors.TooManyRequests)):
+            return RATE_LIMIT
+        if isinstance(exc, api_errors.DeadlineExceeded):
+            return TIMEOUT
+        if isinstance(exc, api_errors.ServerError):
+            return SERVER
+        if isinstance(exc, (BlockedPromptException, StopCandidateException)):
+            return SAFETY
+
+    # response.text raises ValueError when the candidate was blocked
+    message = str(exc).lower()
+    if isinstance(exc, ValueError) and ("safety" in message or "block" in message):
+        return SAFETY
+    return OTHER
+
+
+def check_safety(response):
+    feedback = getattr(response, "prompt_feedback", None)
+    if feedback is not None and getattr(feedback, "block_reason", 0):
+        raise SafetyBlocked(f"Prompt blocked: {feedback.block_reason}")
+
+    for candidate in getattr(response, "candidates", None) or []:
+        if getattr(candidate.finish_reason, "name", "") == "SAFETY":
+            raise SafetyBlocked("Response blocked by safety filter")
+
+
+# ================= TYPED RESULT =================
+class AIResult(str):
+    # Still a plain string for existing callers (markdown, .lower(), PDF...),
+    # plus ok / kind so tabs can render failures differently.
+    def __new__(cls, text, ok=True, kind=None, detail=""):
+        obj = super().__new__(cls, text)
+        obj.ok = ok
+        obj.kind = kind
+        obj.detail = detail
+        return obj
+
+    @classmethod
+    def failure(cls, exc):
+        kind = classify_error(exc)
+        text = ERROR_MESSAGES.get(kind, f"Error generating response: {exc}")
+        return cls(text, ok=False, kind=kind, detail=str(exc))
+
+
+# ================= CIRCUIT BREAKER =================
+class CircuitBreaker:
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+        self.times_opened = 0
+        self.open_seconds = 0.0
+        self.fast_failures = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            # half open: let exactly one trial call through
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            self.fast_failures += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                self.open_seconds += time.monotonic() - self._opened_at
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or (self._opened_at is None and self._failures >= self.threshold):
+                if self._opened_at is None:
+                    self.times_opened += 1
+                else:
+                    self.open_seconds += time.monotonic() - self._opened_at
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release_trial(self):
+        # the call neither proved the upstream healthy nor unhealthy
+        with self._lock:
+            self._trial_running = False
+
+    def retry_after(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def stats(self):
+        with self._lock:
+            open_now = time.monotonic() - self._opened_at if self._opened_at else 0.0
+            return {
+                "state": self._state(),
+                "times_opened": self.times_opened,
+                "open_seconds": round(self.open_seconds + open_now, 1),
+                "fast_failures": self.fast_failures,
+            }
+
+
+# ================= RETRY WITH JITTERED BACKOFF =================
+class Resilience:
+    def __init__(self, breaker, attempts=RETRY_ATTEMPTS):
+        self.breaker = breaker
+        self.attempts = attempts
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.failures = {}   # error kind -> count
+
+    def backoff(self, attempt):
+        # "full jitter": spreads retries from many sessions over the window
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    def call(self, fn, *args, can_retry=None, deadline=None):
+        # can_retry() lets streaming callers stop retrying once output was sent.
+        # With a deadline (time.monotonic()), every attempt gets what is left
+        # of it as fn(..., timeout=seconds), and no retry starts past it.
+        for attempt in range(self.attempts):
+            kwargs = {}
+            if deadline is not None:
+                kwargs["timeout"] = deadline - time.monotonic()
+                if kwargs["timeout"] <= 0:
+                    raise AITimeout("AI request deadline passed before the call started")
+
+            if not self.breaker.allow():
+                raise CircuitOpen(f"retry in {self.breaker.retry_after():.0f}s")
+
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                kind = classify_error(exc)
+                self._count_failure(kind)
+
+                if kind in RETRYABLE:
+                    self.breaker.record_failure()
+                else:
+                    # a bad request or a safety block says nothing about
+                    # upstream health: don't close an open breaker on it
+                    self.breaker.release_trial()
+
+                last_attempt = attempt == self.attempts - 1
+                if kind not in RETRYABLE or last_attempt or (can_retry and not can_retry()):
+                    raise
+
+                pause = self.backoff(attempt)
+                if deadline is not None and time.monotonic() + pause + RETRY_MIN_TIMEOUT > deadline:
+                    # the caller gives up before another attempt could finish
+                    raise
+
+                with self._lock:
+                    self.retries += 1
+                time.sleep(pause)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def _count_failure(self, kind):
+        with self._lock:
+            self.failures[kind] = self.failures.get(kind, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            stats = {"retries": self.retries, "failures": dict(self.failures)}
+        stats["breaker"] = self.breaker.stats()
+        return stats
+
+
+# Shared by every Streamlit session in this process.
+circuit_breaker = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_COOLDOWN)
+resilience = Resilience(circuit_breaker, RETRY_ATTEMPTS)
@@ -0,0 +1,159 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+# ================= CACHE CONFIG =================
+# AI_CACHE_DIR empty  -> memory only
+# AI_CACHE_DIR=.ai_cache -> responses also survive restarts
+CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "512"))
+CACHE_DIR = os.getenv("AI_CACHE_DIR", "")
+DEFAULT_TTL = int(os.getenv("AI_CACHE_TTL", "3600"))
+
+# Seconds a response stays valid, per feature. 0 = never cache.
+# Override any of them with AI_CACHE_TTL_<FEATURE>, e.g. AI_CACHE_TTL_MEAL_PLAN=600
+FEATURE_TTL = {
+    "health_tips": 6 * 3600,
+    "quick_scan": 6 * 3600,
+    "meal_plan": 24 * 3600,
+    "food_analysis": 24 * 3600,
+    "food_scan": 24 * 3600,
+    "skin_analysis": 24 * 3600,
+    "health_insights": 12 * 3600,
+    "mood_detect": 24 * 3600,
+    "voice_mood": 24 * 3600,
+    # conversational answers depend on memory / live voice, keep them fresh
+    "voice_intent": 0,
+    "voice_symptoms": 0,
+}
+
+
+def feature_ttl(feature):
+    env_value = os.getenv(f"AI_CACHE_TTL_{feature.upper()}")
+    if env_value is not None:
+        return int(env_value)
+    return FEATURE_TTL.get(feature, DEFAULT_TTL)
+
+
+def normalize_prompt(prompt):
+    # Prompts are built from indented f-strings, so the same request can differ
+    # only in whitespace. Strip that before hashing.
+    lines = (re.sub(r"\s+", " ", line).strip() for line in prompt.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def make_cache_key(personality, prompt, image_bytes=None, model_name=""):
+    image_hash = hashlib.sha256(image_bytes).hexdigest() if image_bytes else ""
+
+    h = hashlib.sha256()
+    for part in (personality, normalize_prompt(prompt), image_hash, model_name):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# ================= LRU + TTL CACHE =================
+class ResponseCache:
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, cache_dir=None):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()   # key -> (expires_at, text)
+        self._lock = threading.Lock()
+        self._db = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if cache_dir:
+            self._open_disk(cache_dir)
+
+    def _open_disk(self, cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._db = sqlite3.connect(
+            os.path.join(cache_dir, "responses.sqlite"),
+            check_same_thread=False
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, expires_at REAL, text TEXT)"
+        )
+        self._db.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        self._db.commit()
+
+    def get(self, key):
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, text = entry
+                if expires_at >= now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return text
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT expires_at, text FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[0] >= now:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[1]
+
+            self.misses += 1
+            return None
+
+    def set(self, key, text, ttl):
+        if ttl <= 0:
+            return
+
+        expires_at = time.time() + ttl
+
+        with self._lock:
+            self._remember(key, expires_at, text)
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, expires_at, text)
+                )
+                self._db.commit()
+
+    def _remember(self, key, expires_at, text):
+        self._entries[key] = (expires_at, text)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+# One cache per process, shared by every Streamlit session.
+response_cache = ResponseCache(CACHE_MAX_ENTRIES, CACHE_DIR or None)
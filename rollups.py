@@ -0,0 +1,77 @@
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+# ================= ROLLUP CONFIG =================
+# Numeric histories keep daily / weekly / monthly aggregates next to the raw
+# points. Raw points older than HISTORY_RETENTION_DAYS are deleted; the
+# rollups still cover them, so long-range charts read a few hundred buckets
+# instead of years of entries.
+HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", "90"))
+ROLLUP_PRUNE_INTERVAL = int(os.getenv("ROLLUP_PRUNE_INTERVAL", "3600"))
+
+ROLLUP_SERIES = ("weight_history", "sleep_history", "water_history")
+RESOLUTIONS = ("daily", "weekly", "monthly")
+
+# chart zoom -> (days shown, resolution); None resolution = raw points
+ZOOM_LEVELS = {
+    "Week": (7, None),
+    "Month": (31, "daily"),
+    "6 Months": (183, "weekly"),
+    "All": (None, "monthly"),
+}
+
+
+def bucket(ts, resolution):
+    # ISO date of the period start, so buckets sort as text
+    day = datetime.fromtimestamp(ts).date()
+    if resolution == "weekly":
+        day -= timedelta(days=day.weekday())
+    elif resolution == "monthly":
+        day = day.replace(day=1)
+    return day.isoformat()
+
+
+# ================= AGGREGATES =================
+class Rollup:
+    def __init__(self, resolution, rows=()):
+        self.resolution = resolution
+        # bucket -> [count, total, lo, hi, last, last_ts]
+        self.buckets = {row[0]: list(row[1:]) for row in rows}
+
+    def add(self, ts, value):
+        key = bucket(ts, self.resolution)
+        agg = self.buckets.get(key)
+        if agg is None:
+            self.buckets[key] = [1, value, value, value, value, ts]
+            return
+
+        agg[0] += 1
+        agg[1] += value
+        agg[2] = min(agg[2], value)
+        agg[3] = max(agg[3], value)
+        if ts >= agg[5]:
+            agg[4], agg[5] = value, ts
+
+    def rows(self):
+        return [(key, *agg) for key, agg in self.buckets.items()]
+
+    @classmethod
+    def from_series(cls, series, resolution):
+        # for series that have no stored rollups (guests)
+        rollup = cls(resolution)
+        for ts, value in zip(series.timestamps.tolist(), series.tolist()):
+            rollup.add(ts, value)
+        return rollup
+
+    def frame(self, since=None):
+        rows = [
+            (key, count, round(total / count, 2), lo, hi, last)
+            for key, (count, total, lo, hi, last, _) in sorted(self.buckets.items())
+            if since is None or key >= since
+        ]
+        df = pd.DataFrame(rows, columns=["Period", "count", "mean", "min", "max", "last"])
+        df["Period"] = pd.to_datetime(df["Period"])
+        return df.set_index("Period")
@@ -0,0 +1,33 @@
+import os
+import sys
+
+from dotenv import load_dotenv
+
+
+# ================= SERVER LAUNCHER WITH WARM-UP =================
+# Use instead of "streamlit run Nutrition1.py" on autoscaled replicas:
+#
+#   python serve.py --server.port 8501 --server.headless true
+#
+# Builds the shared Gemini model before the server starts listening, in the
+# same process, so st.cache_resource already holds it when the first session
+# runs the script.
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Nutrition1.py")
+
+
+def main():
+    load_dotenv()
+
+    from clients import warm_up
+    timings = warm_up()
+    print("Warm-up: " + ", ".join(f"{name} {sec * 1000:.0f} ms" for name, sec in timings.items()))
+
+    from streamlit.web import cli
+    # static/app.css (theme.py) - also when launched outside the app dir
+    sys.argv = ["streamlit", "run", APP_SCRIPT, "--server.enableStaticServing", "true"] + sys.argv[1:]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import threading
+
+from ai_executor import ai_executor, AICancelled, AITimeout
+
+
+# ================= SINGLE-FLIGHT (REQUEST COALESCING) =================
+# Sessions asking for the same cache key while a call is already running
+# wait on that call's future instead of starting their own. do() returns
+# (result, leader) so only the session that made the call accounts for it.
+class _Flight:
+    def __init__(self, future):
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, executor=ai_executor):
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._flights = {}   # key -> _Flight
+
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            flight = self._flights.get(key)
+
+            if flight is None or flight.future.done():
+                future = self.executor.submit(fn, *args, shared=True)
+                flight = _Flight(future)
+                self._flights[key] = flight
+                self.leaders += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+            flight.waiters += 1
+
+        if leader:
+            flight.future.add_done_callback(lambda _: self._finish(key, flight))
+
+        try:
+            return self.executor.wait(flight.future, cancel=False), leader
+        except (AICancelled, AITimeout):
+            self._abandon(key, flight)
+            raise
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+
+    def _abandon(self, key, flight):
+        # Last interested session gone -> nobody needs the upstream call.
+        with self._lock:
+            if flight.waiters > 1:
+                return
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        self.executor.abandon(flight.future)
+
+    def _finish(self, key, flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "upstream_calls": self.leaders,
+                "coalesced": self.coalesced,
+            }
+
+
+# Shared by every Streamlit session in this process.
+single_flight = SingleFlight(ai_executor)
@@ -0,0 +1,591 @@
+import csv
+import io
+import logging
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from write_buffer import WriteBehindBuffer, WRITE_BEHIND
+
+try:
+    import fcntl   # not on Windows; the thread lock still covers one process
+except ImportError:
+    fcntl = None
+
+
+# ================= STORAGE CONFIG =================
+DATA_FILE = os.getenv("FITNESS_DATA_FILE", "fitness_data.csv")
+
+# always   -> fsync after every save (no data lost on power cut)
+# interval -> fsync at most every FITNESS_FSYNC_INTERVAL seconds
+# never    -> leave it to the OS
+FSYNC_POLICY = os.getenv("FITNESS_FSYNC", "always").lower()
+FSYNC_INTERVAL = float(os.getenv("FITNESS_FSYNC_INTERVAL", "1.0"))
+
+# sqlite -> fitness_data.sqlite (WAL, indexed); the CSV is imported once and
+#           stays available as an export
+# csv    -> append-only fitness_data.csv, read with pandas
+# parquet -> columnar files partitioned by day (needs pyarrow)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "sqlite").lower()
+DB_FILE = os.getenv("FITNESS_DB_FILE", "fitness_data.sqlite")
+DB_POOL_SIZE = int(os.getenv("FITNESS_DB_POOL", "4"))
+
+# parquet -> fitness_parquet/date=YYYY-MM-DD/*.parquet, for analytics
+PARQUET_DIR = os.getenv("FITNESS_PARQUET_DIR", "fitness_parquet")
+COMPACT_INTERVAL = float(os.getenv("FITNESS_COMPACT_INTERVAL", "60"))
+COMPACT_MIN_FILES = int(os.getenv("FITNESS_COMPACT_MIN_FILES", "8"))
+
+# Column order of fitness_data.csv. New columns go at the end; older files
+# are migrated once when the writer first sees them.
+# Username is the display name; UserId the hashed account / browser link
+# (identity.public_id), empty on rows saved before it existed.
+FIELDS = ["Username", "Weight", "Water", "BMI", "Date", "UserId"]
+
+logger = logging.getLogger(__name__)
+
+
+def _format(value):
+    # same text pandas.to_csv wrote: None/NaN -> empty cell
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return str(value)
+
+
+def _read_header(path):
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), None)
+    except FileNotFoundError:
+        return None
+
+
+# ================= ONE-TIME MIGRATION =================
+def migrate_csv(path, fields=FIELDS):
+    # Rewrites an existing CSV with the current column order: missing columns
+    # become empty, extra columns are kept at the end. Atomic via os.replace.
+    header = _read_header(path)
+    if header is None or header == list(fields):
+        return False
+
+    columns = list(fields) + [c for c in header if c not in fields]
+    tmp_path = f"{path}.{os.getpid()}.migrating"
+
+    with open(path, newline="", encoding="utf-8") as src, \
+            open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+        reader = csv.DictReader(src)
+        writer = csv.DictWriter(dst, fieldnames=columns, restval="")
+        writer.writeheader()
+        for row in reader:
+            row.pop(None, None)   # stray cells from a torn line
+            writer.writerow(row)
+        dst.flush()
+        os.fsync(dst.fileno())
+
+    os.replace(tmp_path, path)
+    return True
+
+
+# ================= APPEND-ONLY CSV WRITER =================
+class CsvAppendWriter:
+    def __init__(self, path=DATA_FILE, fields=FIELDS,
+                 fsync_policy=FSYNC_POLICY, fsync_interval=FSYNC_INTERVAL):
+        self.path = path
+        self.fields = list(fields)
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._columns = None   # header of the file on disk
+        self._last_fsync = 0.0
+
+        self.appends = 0
+        self.fsyncs = 0
+
+    def _prepare(self):
+        # once per process: bring an old file up to the current schema
+        if self._columns is None:
+            migrate_csv(self.path, self.fields)
+            self._columns = _read_header(self.path) or self.fields
+
+    def _encode(self, records):
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        for record in records:
+            writer.writerow(_format(record.get(c)) for c in self._columns)
+        return buf.getvalue().encode("utf-8")
+
+    def append(self, record):
+        self.append_many([record])
+
+    def append_many(self, records):
+        with self._lock:
+            self._prepare()
+
+            unknown = {k for r in records for k in r} - set(self._columns)
+            if unknown:
+                raise ValueError(f"Unknown columns for {self.path}: {sorted(unknown)}")
+
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+
+                data = self._encode(records)
+                size = os.fstat(fd).st_size
+                if size == 0:
+                    header = ",".join(self._columns) + "\n"
+                    data = header.encode("utf-8") + data
+                elif not self._ends_with_newline(size):
+                    # last write was torn (crash mid-line) -> don't glue rows
+                    data = b"\n" + data
+
+                # one write() on an O_APPEND fd: never interleaves with other writers
+                os.write(fd, data)
+                self._maybe_fsync(fd)
+                self.appends += len(records)
+            finally:
+                os.close(fd)
+
+    def _ends_with_newline(self, size):
+        with open(self.path, "rb") as f:
+            f.seek(size - 1)
+            return f.read(1) == b"\n"
+
+    def _maybe_fsync(self, fd):
+        now = time.monotonic()
+        if self.fsync_policy == "always" or (
+            self.fsync_policy == "interval" and now - self._last_fsync >= self.fsync_interval
+        ):
+            os.fsync(fd)
+            self._last_fsync = now
+            self.fsyncs += 1
+
+    def stats(self):
+        with self._lock:
+            return {"appends": self.appends, "fsyncs": self.fsyncs, "policy": self.fsync_policy}
+
+
+# ================= STORES =================
+# Both stores answer the same questions; the app only talks to fitness_store.
+#   add(record) / add_many(records)
+#   daily_summary(since=None)   -> DataFrame [UserId, Username, Day, Entries, LastDate, LastWeight]
+#                                  (one row per user per day from the day `since` on,
+#                                  feeds leaderboard.py; UserId falls back to Username)
+#   user_records(user_id, since) -> DataFrame [Date, Weight, Water, BMI] of one user from the
+#                                  day `since` on, oldest first
+#   export_csv_bytes()          -> CSV file contents
+class CsvStore:
+    def __init__(self, path=DATA_FILE):
+        self.path = path
+        self.writer = CsvAppendWriter(path, FIELDS)
+
+    def add(self, record):
+        self.writer.append(record)
+
+    def add_many(self, records):
+        self.writer.append_many(records)
+
+    def _read(self):
+        import pandas as pd
+        try:
+            return pd.read_csv(self.path)
+        except FileNotFoundError:
+            return pd.DataFrame(columns=FIELDS)
+
+    def daily_summary(self, since=None):
+        return _daily_summary(self._read(), since)
+
+    def user_records(self, user_id, since):
+        return _user_records(self._read(), user_id, since)
+
+    def export_csv_bytes(self):
+        try:
+            with open(self.path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return (",".join(FIELDS) + "\n").encode("utf-8")
+
+    def stats(self):
+        return {"backend": "csv", **self.writer.stats()}
+
+
+def _user_records(df, user_id, since):
+    import pandas as pd
+
+    df = df[df["UserId"] == user_id] if "UserId" in df else df.iloc[0:0]
+    df = df.assign(Date=pd.to_datetime(df["Date"], errors="coerce", format="mixed"))
+    df = df[df["Date"] >= pd.Timestamp(since)].sort_values("Date")
+    return df[["Date", "Weight", "Water", "BMI"]].reset_index(drop=True)
+
+
+def _daily_summary(df, since=None):
+    import pandas as pd
+
+    df = df.dropna(subset=["Username", "Date"]).copy()
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce", format="mixed")
+    df = df.dropna(subset=["Date"]).sort_values("Date")
+    if since is not None:
+        df = df[df["Date"] >= pd.Timestamp(since)]
+    df["Day"] = df["Date"].dt.strftime("%Y-%m-%d")
+    user_ids = df["UserId"] if "UserId" in df else pd.Series(None, index=df.index, dtype=object)
+    df["UserId"] = user_ids.fillna(df["Username"])
+
+    return (
+        df.groupby(["UserId", "Day"])
+        .agg(Username=("Username", "last"), Entries=("Date", "size"),
+             LastDate=("Date", "last"), LastWeight=("Weight", "last"))
+        .reset_index()
+        [["UserId", "Username", "Day", "Entries", "LastDate", "LastWeight"]]
+    )
+
+
+class SqlitePool:
+    def __init__(self, path, size=DB_POOL_SIZE):
+        self.path = path
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._connect())
+
+    def _connect(self):
+        # check_same_thread=False: Streamlit runs every session's script on its
+        # own thread; the pool makes sure one connection has one user at a time
+        db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, cached_statements=64)
+        db.execute("PRAGMA journal_mode=WAL")       # readers don't block the writer
+        db.execute("PRAGMA synchronous=NORMAL")     # safe with WAL, far fewer fsyncs
+        return db
+
+    @contextmanager
+    def connection(self):
+        db = self._idle.get()
+        try:
+            with db:   # commit, or roll back on error
+                yield db
+        finally:
+            self._idle.put(db)
+
+    def idle(self):
+        return self._idle.qsize()
+
+
+class SqliteStore:
+    # fixed SQL text -> sqlite3 keeps these prepared per connection
+    INSERT = "INSERT INTO fitness (username, weight, water, bmi, date, user_id) VALUES (?, ?, ?, ?, ?, ?)"
+    # range scan on idx_fitness_user_id_date
+    USER_RECORDS = (
+        "SELECT date, weight, water, bmi FROM fitness "
+        "WHERE user_id = ? AND date >= ? ORDER BY date"
+    )
+    # SQLite fills bare columns next to MAX() from the row holding the max,
+    # so name and weight are the last ones of that day
+    DAILY = (
+        "SELECT COALESCE(user_id, username) AS uid, username, substr(date, 1, 10) AS day, "
+        "COUNT(*), MAX(date), weight "
+        "FROM fitness WHERE date >= ? GROUP BY uid, day"
+    )
+
+    def __init__(self, path=DB_FILE, pool_size=DB_POOL_SIZE, import_csv=DATA_FILE):
+        self.path = path
+        self._pool = SqlitePool(path, pool_size)
+
+        with self._pool.connection() as db:
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS fitness (
+                    id INTEGER PRIMARY KEY,
+                    username TEXT NOT NULL,
+                    weight REAL,
+                    water INTEGER,
+                    bmi REAL,
+                    date TEXT,
+                    user_id TEXT
+                );
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            """)
+            # databases created before UserId existed
+            columns = {row[1] for row in db.execute("PRAGMA table_info(fitness)")}
+            if "user_id" not in columns:
+                db.execute("ALTER TABLE fitness ADD COLUMN user_id TEXT")
+            # per-user lookups go by account, not by the display name
+            db.execute("DROP INDEX IF EXISTS idx_fitness_user_date")
+            db.execute("CREATE INDEX IF NOT EXISTS idx_fitness_user_id_date ON fitness (user_id, date)")
+            # leaderboard refreshes re-read only the last days
+            db.execute("CREATE INDEX IF NOT EXISTS idx_fitness_date ON fitness (date)")
+
+        if import_csv:
+            self._import_csv_once(import_csv)
+
+    def _import_csv_once(self, csv_path):
+        with self._pool.connection() as db:
+            done = db.execute("SELECT value FROM meta WHERE key = 'csv_imported'").fetchone()
+            if done or not os.path.exists(csv_path):
+                return
+
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = [self._row(r) for r in csv.DictReader(f) if r.get("Username")]
+            db.executemany(self.INSERT, rows)
+            db.execute("INSERT INTO meta VALUES ('csv_imported', ?)", (csv_path,))
+
+    def _row(self, record):
+        values = []
+        for field in FIELDS:
+            value = record.get(field)
+            if value is None or value == "" or (isinstance(value, float) and value != value):
+                value = None
+            elif field == "Date":
+                value = str(value)
+            values.append(value)
+        return values
+
+    def add(self, record):
+        self.add_many([record])
+
+    def add_many(self, records):
+        unknown = {k for r in records for k in r} - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown columns for fitness table: {sorted(unknown)}")
+
+        # one transaction for the whole batch
+        with self._pool.connection() as db:
+            db.executemany(self.INSERT, [self._row(r) for r in records])
+
+    def daily_summary(self, since=None):
+        import pandas as pd
+        with self._pool.connection() as db:
+            # "" sorts before every date and leaves out NULL dates
+            rows = db.execute(self.DAILY, ("" if since is None else str(since),)).fetchall()
+        return pd.DataFrame(rows, columns=["UserId", "Username", "Day", "Entries", "LastDate", "LastWeight"])
+
+    def user_records(self, user_id, since):
+        import pandas as pd
+        with self._pool.connection() as db:
+            rows = db.execute(self.USER_RECORDS, (user_id, str(since))).fetchall()
+        df = pd.DataFrame(rows, columns=["Date", "Weight", "Water", "BMI"])
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce", format="mixed")
+        return df
+
+    def export_csv_bytes(self):
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(FIELDS)
+        with self._pool.connection() as db:
+            for row in db.execute("SELECT username, weight, water, bmi, date, user_id FROM fitness ORDER BY id"):
+                writer.writerow(_format(v) for v in row)
+        return buf.getvalue().encode("utf-8")
+
+    def stats(self):
+        return {"backend": "sqlite", "path": self.path, "pool_idle": self._pool.idle()}
+
+
+class ParquetStore:
+    # Columnar, hive-partitioned by day. Every save batch becomes a small file
+    # in its day's folder; a background thread merges them so readers open a
+    # few large files with row-group statistics instead of thousands of tiny ones.
+    def __init__(self, root=PARQUET_DIR, compact_interval=COMPACT_INTERVAL,
+                 compact_min_files=COMPACT_MIN_FILES, import_csv=DATA_FILE):
+        import pyarrow as pa
+
+        self.root = root
+        self.compact_min_files = compact_min_files
+        self.schema = pa.schema([
+            ("Username", pa.string()),
+            ("Weight", pa.float64()),
+            ("Water", pa.int64()),
+            ("BMI", pa.float64()),
+            ("Date", pa.timestamp("us")),
+            ("UserId", pa.string()),
+        ])
+        # saves and compaction don't overlap; readers don't take it
+        self._lock = threading.Lock()
+
+        self.files_written = 0
+        self.compactions = 0
+
+        os.makedirs(root, exist_ok=True)
+        if import_csv:
+            self._import_csv_once(import_csv)
+
+        if compact_interval > 0:
+            threading.Thread(
+                target=self._compact_loop, args=(compact_interval,),
+                name="parquet-compactor", daemon=True
+            ).start()
+
+    # ---------------- WRITE ----------------
+    def _import_csv_once(self, csv_path):
+        marker = os.path.join(self.root, "_csv_imported")   # "_" files are ignored by readers
+        if os.path.exists(marker) or not os.path.exists(csv_path):
+            return
+
+        import pandas as pd
+        df = pd.read_csv(csv_path)
+        unknown = [c for c in df.columns if c not in FIELDS]
+        if unknown:
+            # older CSVs may carry extra columns; add_many() would reject them all
+            logger.warning("Skipping unknown columns in %s: %s", csv_path, unknown)
+        df = df.reindex(columns=FIELDS)
+        df = df[df["Username"].notna()]
+        self.add_many(df.to_dict("records"))
+
+        with open(marker, "w") as f:
+            f.write(csv_path)
+
+    def add(self, record):
+        self.add_many([record])
+
+    def add_many(self, records):
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        unknown = {k for r in records for k in r} - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown columns for parquet store: {sorted(unknown)}")
+
+        df = pd.DataFrame(records, columns=FIELDS)
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        df = df[df["Date"].notna()]
+        for column in ("Weight", "Water", "BMI"):
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+
+        with self._lock:
+            for day, rows in df.groupby(df["Date"].dt.strftime("%Y-%m-%d")):
+                folder = os.path.join(self.root, f"date={day}")
+                os.makedirs(folder, exist_ok=True)
+
+                table = pa.Table.from_pandas(rows, schema=self.schema, preserve_index=False)
+                name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+                # write under a hidden name, then rename -> readers never see half a file
+                tmp_path = os.path.join(folder, "." + name)
+                pq.write_table(table, tmp_path)
+                os.replace(tmp_path, os.path.join(folder, name))
+                self.files_written += 1
+
+    # ---------------- COMPACTION ----------------
+    def _compact_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("Parquet compaction failed")
+
+    def compact(self, min_files=None):
+        import pyarrow.parquet as pq
+
+        min_files = min_files or self.compact_min_files
+        merged = 0
+
+        for folder in sorted(os.listdir(self.root)):
+            path = os.path.join(self.root, folder)
+            if not folder.startswith("date=") or not os.path.isdir(path):
+                continue
+
+            with self._lock:
+                files = sorted(f for f in os.listdir(path) if f.endswith(".parquet") and not f.startswith("."))
+                small = [f for f in files if f.startswith("part-")]
+                if len(small) < min_files:
+                    continue
+
+                table = pq.read_table([os.path.join(path, f) for f in small], schema=self.schema)
+                # sorted by user -> row-group min/max make Username filters skip data
+                table = table.sort_by([("Username", "ascending"), ("Date", "ascending")])
+
+                name = f"compacted-{time.time_ns()}.parquet"
+                tmp_path = os.path.join(path, "." + name)
+                pq.write_table(table, tmp_path, row_group_size=128 * 1024)
+                os.replace(tmp_path, os.path.join(path, name))
+                for f in small:
+                    os.remove(os.path.join(path, f))
+
+                merged += len(small)
+                self.compactions += 1
+
+        return merged
+
+    # ---------------- READ ----------------
+    def read(self, columns, username=None, since=None, until=None, user_id=None):
+        # Only the listed columns are decoded (projection). User / Date
+        # filters go to the scanner (pushdown): date= folders outside the
+        # range are never opened, row groups are skipped via min/max stats.
+        import pyarrow.dataset as ds
+
+        conditions = []
+        if username is not None:
+            conditions.append(ds.field("Username") == username)
+        if user_id is not None:
+            conditions.append(ds.field("UserId") == user_id)
+        if since is not None:
+            conditions.append(ds.field("date") >= str(since)[:10])
+        if until is not None:
+            conditions.append(ds.field("date") <= str(until)[:10])
+
+        flt = None
+        for condition in conditions:
+            flt = condition if flt is None else flt & condition
+
+        for attempt in range(3):
+            dataset = ds.dataset(
+                self.root, format="parquet", partitioning="hive", schema=self._dataset_schema()
+            )
+            try:
+                return dataset.to_table(columns=columns, filter=flt)
+            except FileNotFoundError:
+                # compaction removed a file we had just listed -> list again
+                if attempt == 2:
+                    raise
+
+    def _dataset_schema(self):
+        import pyarrow as pa
+        return self.schema.append(pa.field("date", pa.string()))
+
+    def daily_summary(self, since=None):
+        return _daily_summary(self.read(["Username", "Weight", "Date", "UserId"], since=since).to_pandas())
+
+    def user_records(self, user_id, since):
+        columns = ["Date", "Weight", "Water", "BMI"]
+        df = self.read(columns, since=since, user_id=user_id).to_pandas()
+        return df.sort_values("Date").reset_index(drop=True)
+
+    def export_csv_bytes(self):
+        df = self.read(FIELDS).to_pandas().sort_values("Date")
+        df["Water"] = df["Water"].astype("Int64")   # keep "3", not "3.0", next to empty cells
+        return df.to_csv(index=False).encode("utf-8")
+
+    def stats(self):
+        return {
+            "backend": "parquet",
+            "root": self.root,
+            "files_written": self.files_written,
+            "compactions": self.compactions,
+        }
+
+
+def open_store(backend=STORAGE_BACKEND):
+    if backend == "csv":
+        return CsvStore(DATA_FILE)
+    if backend == "parquet":
+        return ParquetStore(PARQUET_DIR, COMPACT_INTERVAL, COMPACT_MIN_FILES, DATA_FILE)
+    return SqliteStore(DB_FILE, DB_POOL_SIZE, DATA_FILE)
+
+
+# Shared by every Streamlit session in this process. Saves are queued and
+# written in batches by write_buffer (WRITE_BEHIND=0 writes synchronously).
+fitness_store = open_store(STORAGE_BACKEND)
+if WRITE_BEHIND:
+    fitness_store = WriteBehindBuffer(fitness_store)
+
+
+if __name__ == "__main__":
+    # python storage.py [fitness_data.csv]  -> one-time migration of the CSV
+    # python storage.py export out.csv      -> dump the current store as CSV
+    if sys.argv[1:2] == ["export"]:
+        target = sys.argv[2] if len(sys.argv) > 2 else "fitness_export.csv"
+        with open(target, "wb") as f:
+            f.write(fitness_store.export_csv_bytes())
+        print(f"exported to {target}")
+    else:
+        target = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+        print("migrated" if migrate_csv(target) else "already up to date")
@@ -0,0 +1,30 @@
+import hashlib
+import os
+
+import streamlit as st
+
+
+# ================= THEME STYLESHEET =================
+# The app's CSS lives in static/app.css and is served by Streamlit's static
+# file server (server.enableStaticServing, set in .streamlit/config.toml).
+# A rerun only sends a <link> whose URL carries the content hash, so the
+# browser downloads the file once per version; the dark/light toggle flips a
+# marker class that the stylesheet keys off instead of injecting new CSS.
+STATIC_CSS = os.getenv("STATIC_CSS", "1") != "0"
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STYLESHEET = "app.css"
+
+with open(os.path.join(STATIC_DIR, STYLESHEET), encoding="utf-8") as f:
+    CSS = f.read()
+CSS_VERSION = hashlib.sha256(CSS.encode("utf-8")).hexdigest()[:12]
+STYLESHEET_URL = f"app/static/{STYLESHEET}?v={CSS_VERSION}"
+
+
+def render_theme(theme):
+    if STATIC_CSS and st.get_option("server.enableStaticServing"):
+        head = f'<link rel="stylesheet" href="{STYLESHEET_URL}">'
+    else:
+        # static serving off (e.g. launched without the config): inline it
+        head = f"<style>{CSS}</style>"
+    st.markdown(f'{head}<span class="theme-{theme}"></span>', unsafe_allow_html=True)
@@ -0,0 +1,216 @@
+import itertools
+import json
+import time
+
+import numpy as np
+
+
+# ================= COMPACT TIME SERIES =================
+# Tracker histories as two NumPy buffers instead of a list of Python
+# objects: float64 values (or int8 codes for moods) plus int64 epoch
+# seconds. A few bytes per entry, and charts / np.polyfit read the
+# buffers directly instead of re-converting a list on every rerun.
+# float64, not float32: 72.3 has to come back as 72.3 in charts and prompts.
+FLOAT = "float"
+CATEGORY = "category"
+
+_DTYPES = {FLOAT: np.float64, CATEGORY: np.int8}
+_MIN_CAPACITY = 16
+
+# identifies a series (and its views) in chart caches; version moves on append
+_tokens = itertools.count(1)
+
+
+class TimeSeries:
+    def __init__(self, kind=FLOAT, categories=(), capacity=_MIN_CAPACITY):
+        if kind not in _DTYPES:
+            raise ValueError(f"Unknown series kind: {kind}")
+        self.kind = kind
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty(capacity, dtype=_DTYPES[kind])
+        self._n = 0
+        self.token = next(_tokens)
+        self.version = 0
+
+        self.categories = list(categories)       # code -> label
+        self._codes = {label: code for code, label in enumerate(self.categories)}
+
+    # ---------------- APPEND ----------------
+    def append(self, value, ts=None):
+        # returns the timestamp actually stored
+        if self._n == len(self._values):
+            self._grow(self._n + 1)
+
+        ts = int(time.time() if ts is None else ts)
+        # keep timestamps sorted so range lookups can binary search
+        if self._n and ts < self._ts[self._n - 1]:
+            ts = int(self._ts[self._n - 1])
+
+        self._ts[self._n] = ts
+        self._values[self._n] = self._encode(value)
+        self._n += 1
+        self.version += 1
+        return ts
+
+    def extend(self, points):
+        # bulk append of (epoch_seconds, value) pairs, oldest first
+        points = list(points)
+        if not points:
+            return
+        ts, values = zip(*points)
+        ts = np.asarray(ts, dtype=np.int64)
+        if self._n:
+            ts = np.maximum(ts, self._ts[self._n - 1])
+
+        n = len(ts)
+        if self._n + n > len(self._values):
+            self._grow(self._n + n)
+        self._ts[self._n:self._n + n] = np.maximum.accumulate(ts)
+        if self.kind == CATEGORY:
+            values = [self._encode(v) for v in values]
+        self._values[self._n:self._n + n] = values
+        self._n += n
+        self.version += 1
+
+    def _grow(self, needed):
+        # doubling -> amortized O(1) append
+        capacity = max(needed, 2 * len(self._values), _MIN_CAPACITY)
+        for name in ("_ts", "_values"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def _encode(self, value):
+        if self.kind == FLOAT:
+            return float(value)
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.categories)
+            if code > np.iinfo(np.int8).max:
+                raise ValueError("Too many distinct categories for an int8 series")
+            self.categories.append(value)
+            self._codes[value] = code
+        return code
+
+    def _decode(self, raw):
+        if self.kind == FLOAT:
+            return float(raw)
+        return self.categories[raw]
+
+    # ---------------- ZERO-COPY VIEWS ----------------
+    @property
+    def values(self):
+        view = self._values[:self._n]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def timestamps(self):
+        view = self._ts[:self._n]
+        view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    def tail(self, n):
+        # the newest n entries
+        return self._view(max(0, self._n - n), self._n)
+
+    def between(self, start=None, end=None):
+        # entries with start <= ts < end (epoch seconds), by binary search
+        ts = self.timestamps
+        lo = 0 if start is None else int(np.searchsorted(ts, start, "left"))
+        hi = self._n if end is None else int(np.searchsorted(ts, end, "left"))
+        return self._view(lo, hi)
+
+    def _view(self, lo, hi):
+        view = TimeSeries.__new__(TimeSeries)
+        view.kind = self.kind
+        view._ts = self._ts[lo:hi]
+        view._values = self._values[lo:hi]
+        view._n = hi - lo
+        view.token = next(_tokens)
+        view.version = 0
+        view.categories = self.categories
+        view._codes = self._codes
+        return view
+
+    # ---------------- SERIALIZATION ----------------
+    # The raw buffers behind a small JSON header: a stored series comes back
+    # with one blob read and two buffer copies, not a decode per entry.
+    def to_bytes(self):
+        header = json.dumps(
+            {"kind": self.kind, "n": self._n, "categories": self.categories}, ensure_ascii=False
+        ).encode("utf-8")
+        return b"".join((
+            len(header).to_bytes(4, "little"),
+            header,
+            self.timestamps.astype("<i8", copy=False).tobytes(),
+            self.values.astype(self._values.dtype.newbyteorder("<"), copy=False).tobytes(),
+        ))
+
+    def load_bytes(self, data):
+        # replaces the contents with a to_bytes() snapshot
+        size = int.from_bytes(data[:4], "little")
+        header = json.loads(data[4:4 + size])
+        n = header["n"]
+        offset = 4 + size
+
+        self.kind = header["kind"]
+        dtype = np.dtype(_DTYPES[self.kind])
+        self._ts = np.empty(max(n, _MIN_CAPACITY), dtype=np.int64)
+        self._values = np.empty(max(n, _MIN_CAPACITY), dtype=dtype)
+        self._ts[:n] = np.frombuffer(data, "<i8", n, offset)
+        self._values[:n] = np.frombuffer(data, dtype.newbyteorder("<"), n, offset + 8 * n)
+        self._n = n
+        self.version += 1
+
+        self.categories = list(header["categories"])
+        self._codes = {label: code for code, label in enumerate(self.categories)}
+        return self
+
+    @staticmethod
+    def from_bytes(data):
+        return TimeSeries().load_bytes(data)
+
+    # ---------------- LIST COMPATIBILITY ----------------
+    # Existing code treats histories as lists: len(), [-1], [-3:], count().
+    def __len__(self):
+        return self._n
+
+    def __bool__(self):
+        return self._n > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._n)
+            if step == 1:
+                return self._view(start, max(start, stop)).tolist()
+            return self.tolist()[index]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("TimeSeries index out of range")
+        return self._decode(self._values[index])
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return f"TimeSeries({self.kind}, {self._n} entries)"
+
+    def count(self, value):
+        if self.kind == FLOAT:
+            return int(np.count_nonzero(self.values == float(value)))
+        code = self._codes.get(value)
+        return 0 if code is None else int(np.count_nonzero(self.values == code))
+
+    def labels(self):
+        return [self.categories[c] for c in self.values.tolist()]
+
+    def tolist(self):
+        if self.kind == CATEGORY:
+            return self.labels()
+        return self.values.tolist()
@@ -0,0 +1,195 @@
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+
+
+# ================= WRITE-BEHIND CONFIG =================
+# Saves return as soon as the record is queued; a background thread writes
+# queued records from all sessions in one batch (one transaction / one
+# append / one fsync) every WRITE_BATCH_SIZE records or WRITE_BATCH_MS.
+WRITE_BEHIND = os.getenv("WRITE_BEHIND", "1") != "0"
+WRITE_BATCH_SIZE = int(os.getenv("WRITE_BATCH_SIZE", "200"))
+WRITE_BATCH_MS = float(os.getenv("WRITE_BATCH_MS", "250"))
+WRITE_QUEUE_MAX = int(os.getenv("WRITE_QUEUE_MAX", "10000"))
+# how long a save may block when the queue is full before it fails
+WRITE_PUT_TIMEOUT = float(os.getenv("WRITE_PUT_TIMEOUT", "5"))
+SHUTDOWN_FLUSH_TIMEOUT = 10
+# reads flush first; past this they go ahead without the still-queued records
+WRITE_FLUSH_TIMEOUT = float(os.getenv("WRITE_FLUSH_TIMEOUT", "2"))
+WRITE_DEAD_LETTER_MAX = int(os.getenv("WRITE_DEAD_LETTER_MAX", "1000"))
+# how long a batch keeps retrying transient errors before it is set aside
+WRITE_RETRY_SECONDS = float(os.getenv("WRITE_RETRY_SECONDS", "60"))
+
+# locked db, disk full, I/O hiccup: the same batch can succeed later.
+# Anything else (bad record, schema mismatch) never will.
+TRANSIENT_ERRORS = (sqlite3.OperationalError, OSError)
+
+logger = logging.getLogger(__name__)
+
+
+class BufferFull(Exception):
+    pass
+
+
+class WriteBehindBuffer:
+    # Wraps a store: add()/add_many() are queued, every other store method
+    # first flushes the queue so reads see this process's own writes.
+    def __init__(self, store, batch_size=WRITE_BATCH_SIZE, batch_ms=WRITE_BATCH_MS,
+                 max_queue=WRITE_QUEUE_MAX, put_timeout=WRITE_PUT_TIMEOUT,
+                 flush_timeout=WRITE_FLUSH_TIMEOUT):
+        self.store = store
+        self.batch_size = batch_size
+        self.batch_delay = batch_ms / 1000
+        self.put_timeout = put_timeout
+        self.flush_timeout = flush_timeout
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._done = threading.Condition()
+        self._pending = 0                  # queued + being written
+        self._flush_now = threading.Event()
+        self._closed = False
+
+        self.batches = 0
+        self.records = 0
+        self.largest_batch = 0
+        self.errors = 0
+        self.dead_lettered = 0
+        self.dead_letters = deque(maxlen=WRITE_DEAD_LETTER_MAX)   # (record, error)
+
+        threading.Thread(target=self._run, name="write-behind", daemon=True).start()
+        atexit.register(self.close)
+
+    # ---------------- WRITE SIDE (script threads) ----------------
+    def add(self, record):
+        if self._closed:
+            self.store.add(record)
+            return
+
+        with self._done:
+            self._pending += 1
+        try:
+            # bounded queue: when the disk can't keep up, saves slow down
+            # instead of memory growing without limit
+            self._queue.put(record, timeout=self.put_timeout)
+        except queue.Full:
+            self._finished(1)
+            raise BufferFull(f"write queue full ({self._queue.maxsize} records)")
+
+    def add_many(self, records):
+        for record in records:
+            self.add(record)
+
+    # ---------------- BACKGROUND WRITER ----------------
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_delay
+
+            # group commit: keep collecting until the batch is full or old enough
+            while len(batch) < self.batch_size and not self._flush_now.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # a flush() also takes whatever is already waiting
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+    def _write(self, batch):
+        dropped = self.dead_lettered
+        try:
+            self._retry(self.store.add_many, batch)
+        except TRANSIENT_ERRORS as e:
+            # still failing after WRITE_RETRY_SECONDS
+            for record in batch:
+                self._dead_letter(record, e)
+        except Exception:
+            # one bad record must not sink the batch or wedge the queue:
+            # write them one at a time and set aside the ones that fail
+            for record in batch:
+                try:
+                    self.store.add(record)
+                except Exception as e:
+                    self._dead_letter(record, e)
+
+        self.batches += 1
+        self.records += len(batch) - (self.dead_lettered - dropped)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        self._finished(len(batch))
+
+    def _retry(self, write, records):
+        give_up = time.monotonic() + WRITE_RETRY_SECONDS
+        delay = 0.1
+        while True:
+            try:
+                return write(records)
+            except TRANSIENT_ERRORS as e:
+                if time.monotonic() + delay > give_up:
+                    raise
+                self.errors += 1
+                logger.warning("Write-behind flush failed, retrying in %.1fs: %s", delay, e)
+                time.sleep(delay)
+                delay = min(delay * 2, 5)
+
+    def _dead_letter(self, record, error):
+        self.errors += 1
+        self.dead_lettered += 1
+        self.dead_letters.append((record, repr(error)))
+        logger.error("Write-behind dropped record %r", record, exc_info=error)
+
+    def _finished(self, n):
+        with self._done:
+            self._pending -= n
+            if self._pending == 0:
+                self._flush_now.clear()
+                self._done.notify_all()
+
+    # ---------------- FLUSH / SHUTDOWN ----------------
+    def flush(self, timeout=None):
+        # False if records are still queued after the timeout
+        timeout = self.flush_timeout if timeout is None else timeout
+        with self._done:
+            if self._pending == 0:
+                return True
+            self._flush_now.set()
+            return self._done.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self):
+        # atexit: Streamlit stopping (Ctrl+C / SIGTERM) still writes the queue
+        if not self._closed:
+            self.flush(SHUTDOWN_FLUSH_TIMEOUT)
+            self._closed = True
+
+    def stats(self):
+        return {
+            "queued": self._pending,
+            "batches": self.batches,
+            "records": self.records,
+            "avg_batch": round(self.records / self.batches, 1) if self.batches else 0,
+            "largest_batch": self.largest_batch,
+            "errors": self.errors,
+            "dead_letters": self.dead_lettered,
+            "store": self.store.stats(),
+        }
+
+    def __getattr__(self, name):
+        # reads (leaderboard, export, ...) go to the store after a flush; a
+        # store that can't keep up delays them by flush_timeout at most
+        if not self.flush():
+            logger.warning("Write-behind flush timed out, %s reads without %d queued records",
+                           name, self._pending)
+        return getattr(self.store, name)